@@ -51,8 +51,12 @@ class SetupOrchestrator:
         self.venv_manager = VirtualEnvironmentManager()
         self.dependency_installer = DependencyInstaller()
         self.pyproject_generator = PyprojectGenerator()
-        self.preference_manager = PreferenceManager()
+        self.preference_manager = PreferenceManager.default()
         self.project_config_manager = ProjectConfigManager()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear per-run wizard state so the orchestrator can be reused."""
         self.setup_type: Optional[SetupType] = None
         self.project_path: Optional[Path] = None
         self.project_config: Optional[ProjectConfiguration] = None
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed safe loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigLoadError(Exception):
     """Raised when configuration loading fails."""
@@ -65,16 +68,36 @@ class ConfigLoader:
             raise ConfigLoadError(f"Setup type not found: {slug}")
 
         try:
-            with open(yaml_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            raw = yaml_path.read_bytes()
+        except OSError as e:
+            raise ConfigLoadError(f"Error loading setup type {slug}: {e}") from e
+
+        setup_type = self._parse_setup_type_from_bytes(raw, slug)
+        self._cache[slug] = setup_type
+        logger.info(f"Loaded setup type: {slug}")
+        return setup_type
+
+    def _parse_setup_type_from_bytes(self, raw: bytes, slug: str) -> SetupType:
+        """
+        Parse and validate a setup type from raw YAML bytes.
+
+        Args:
+            raw: YAML document contents
+            slug: Setup type slug, used in error messages
+
+        Returns:
+            SetupType instance
+
+        Raises:
+            ConfigLoadError: If the YAML is invalid or validation fails
+        """
+        try:
+            data = yaml.load(raw, Loader=_YamlLoader)
 
             if data is None:
-                raise ConfigLoadError(f"Empty YAML file: {yaml_path}")
+                raise ConfigLoadError(f"Empty YAML file: {slug}.yaml")
 
-            setup_type = SetupType(**data)
-            self._cache[slug] = setup_type
-            logger.info(f"Loaded setup type: {slug}")
-            return setup_type
+            return SetupType(**data)
 
         except yaml.YAMLError as e:
             raise ConfigLoadError(f"Invalid YAML in {slug}.yaml: {e}") from e
@@ -16,6 +16,16 @@ from typysetup.utils.rollback_context import RollbackContext
 logger = logging.getLogger(__name__)
 console = Console()
 
+# First character that ends the name in a requirement spec (extras, operators, markers)
+_PKG_NAME_SPLIT_RE = re.compile(r"[\s<>=!~;\[]")
+
+# Installer output patterns for _parse_installed_packages
+_PIP_INSTALLED_RE = re.compile(r"Successfully installed (.+)")
+_UV_SUMMARY_RE = re.compile(r"Installed \d+ package")
+# "package-version" items; the version is whatever follows the last hyphen
+_PKG_VERSION_RE = re.compile(r"(\S+)-([^\s-]+)")
+_POETRY_INSTALLING_RE = re.compile(r"Installing[ \t]+(\S+)[ \t]+\(([^)\n]+)\)")
+
 
 class DependencyInstaller:
     """Install dependencies using selected package manager.
@@ -239,37 +249,24 @@ class DependencyInstaller:
 
         if package_manager == "pip":
             # Pip output format: "Successfully installed package1-version package2-version ..."
-            match = re.search(r"Successfully installed (.+)", output)
+            match = _PIP_INSTALLED_RE.search(output)
             if match:
-                installed = match.group(1).split()
-                for item in installed:
-                    # Format is "package-version"
-                    if "-" in item:
-                        parts = item.rsplit("-", 1)
-                        if len(parts) == 2:
-                            packages.append((parts[0], parts[1]))
+                packages = [
+                    (m.group(1), m.group(2)) for m in _PKG_VERSION_RE.finditer(match.group(1))
+                ]
 
         elif package_manager == "uv":
-            # UV output similar to pip
-            match = re.search(r"Installed \d+ package", output)
-            if match:
-                # Try to extract from "Successfully installed" line
-                for line in output.split("\n"):
-                    if "Successfully installed" in line:
-                        installed = line.replace("Successfully installed", "").strip()
-                        for item in installed.split():
-                            if "-" in item:
-                                parts = item.rsplit("-", 1)
-                                if len(parts) == 2:
-                                    packages.append((parts[0], parts[1]))
+            # UV output similar to pip, behind an "Installed N packages" summary
+            if _UV_SUMMARY_RE.search(output):
+                packages = [
+                    (m.group(1), m.group(2))
+                    for line in _PIP_INSTALLED_RE.finditer(output)
+                    for m in _PKG_VERSION_RE.finditer(line.group(1))
+                ]
 
         elif package_manager == "poetry":
-            # Poetry output is more verbose, extract from "Installing" lines
-            for line in output.split("\n"):
-                # Format: "Installing package (version)"
-                match = re.search(r"Installing\s+(\S+)\s+\(([^)]+)\)", line)
-                if match:
-                    packages.append((match.group(1), match.group(2)))
+            # Poetry output is more verbose, extract from "Installing package (version)" lines
+            packages = [(m.group(1), m.group(2)) for m in _POETRY_INSTALLING_RE.finditer(output)]
 
         logger.debug(f"Parsed {len(packages)} packages from {package_manager} output")
         return packages
@@ -312,17 +309,9 @@ class DependencyInstaller:
         Returns:
             Package name only
         """
-        # Remove version specifiers and extras
         # Format: package[extra1,extra2]>=version,<version2
-        # Extract just the package name before [ or >= or > or < or == or !=
-
-        # First remove extras (everything in brackets)
-        package_name = re.sub(r"\[.*?\]", "", package_spec)
-
-        # Then remove version specifiers
-        package_name = re.split(r"[><=!~]", package_name)[0].strip()
-
-        return package_name
+        # The name is everything before the first [ or version operator
+        return _PKG_NAME_SPLIT_RE.split(package_spec.strip(), 1)[0]
 
     def _restore_pyproject(self, pyproject_path: Path, backup_path: Path) -> None:
         """Restore pyproject.toml from backup on rollback.
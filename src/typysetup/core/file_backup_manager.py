@@ -1,5 +1,6 @@
 """File backup and restore manager for safe config updates."""
 
+import os
 import shutil
 from datetime import UTC, datetime
 from pathlib import Path
@@ -81,9 +82,19 @@ class FileBackupManager:
             List of backup paths, sorted newest first
         """
         filepath = Path(filepath)
-        backup_pattern = f"{filepath.name}{FileBackupManager.BACKUP_SUFFIX}.*"
+        prefix = f"{filepath.name}{FileBackupManager.BACKUP_SUFFIX}."
+
+        # Single directory scan with a literal prefix match (no fnmatch pattern compilation)
+        try:
+            with os.scandir(filepath.parent) as entries:
+                backups = [
+                    filepath.parent / entry.name
+                    for entry in entries
+                    if entry.name.startswith(prefix) and len(entry.name) > len(prefix)
+                ]
+        except FileNotFoundError:
+            return []
 
-        backups = list(filepath.parent.glob(backup_pattern))
         # Sort by timestamp in filename (newest first)
         backups.sort(reverse=True)
 
@@ -1,11 +1,11 @@
 """User preference management with atomic file operations."""
 
-import json
 import logging
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple
 
 from pydantic import ValidationError
 
@@ -14,6 +14,9 @@ from typysetup.utils.paths import ensure_config_dir_exists, get_preferences_file
 
 logger = logging.getLogger(__name__)
 
+# Field names accepted by update_preference, computed once at import
+_VALID_PREF_KEYS: FrozenSet[str] = frozenset(UserPreference.model_fields)
+
 
 class PreferenceLoadError(Exception):
     """Raised when preferences cannot be loaded."""
@@ -27,6 +30,68 @@ class PreferenceSaveError(Exception):
     pass
 
 
+def _write_durably(path: Path, payload: bytes) -> None:
+    """Write bytes to a file through a raw descriptor and fsync before closing.
+
+    Args:
+        path: File to create or truncate
+        payload: Bytes to write
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o600)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(path: Path) -> None:
+    """Flush a directory entry so a preceding rename survives a crash.
+
+    Not supported on every platform (e.g. Windows), so failures are ignored.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Back up a file by hardlinking it, falling back to a copy across filesystems.
+
+    The hardlink keeps the old inode alive after ``src`` is atomically replaced, so the
+    backup holds the previous contents without copying any data. Callers must replace
+    ``src`` afterwards; until then the backup and the live file share an inode.
+
+    The link or copy is staged under a temporary name and renamed onto ``dst``, so an
+    existing backup survives if both the link and the copy fail.
+
+    Args:
+        src: File to back up
+        dst: Backup path (replaced if it exists)
+    """
+    staging = dst.with_name(dst.name + ".tmp")
+    staging.unlink(missing_ok=True)
+    try:
+        try:
+            os.link(src, staging)
+        except OSError:
+            shutil.copy2(src, staging)
+        os.replace(staging, dst)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
+
+
 class PreferenceManager:
     """Manages user preferences with atomic writes and backup.
 
@@ -35,6 +100,9 @@ class PreferenceManager:
     backup/recovery mechanisms.
     """
 
+    # Shared managers for the default preferences path, keyed by that path
+    _default_instances: ClassVar[Dict[Path, "PreferenceManager"]] = {}
+
     def __init__(self, preferences_path: Optional[Path] = None):
         """Initialize preference manager.
 
@@ -44,12 +112,96 @@ class PreferenceManager:
         """
         self.preferences_path = preferences_path or get_preferences_file_path()
         self._preferences: Optional[UserPreference] = None
+        # Depth of nested ``with`` blocks; while above zero, updates stay in memory
+        self._batch_depth: int = 0
+        self._dirty: bool = False
+        # Content (minus last_updated) of our last write, to skip no-op saves
+        self._saved_state: Optional[str] = None
+        # stat() signature of the file as we last read or wrote it, to detect external changes
+        self._disk_signature: Optional[Tuple[int, int, int, int]] = None
+
+    @classmethod
+    def default(cls) -> "PreferenceManager":
+        """Return the shared manager for the default preferences file.
+
+        Callers in the same process reuse one instance and its cached preferences.
+        Instances are keyed by the resolved path, so a different home directory
+        gets its own manager.
+
+        Returns:
+            PreferenceManager for the default preferences path
+        """
+        path = get_preferences_file_path()
+        manager = cls._default_instances.get(path)
+        if manager is None:
+            manager = cls._default_instances[path] = cls(path)
+        return manager
 
-    def load_preferences(self, create_if_missing: bool = True) -> UserPreference:
+    @property
+    def preferences_path(self) -> Path:
+        """Path to the preferences file."""
+        return self._preferences_path
+
+    @preferences_path.setter
+    def preferences_path(self, path: Path) -> None:
+        """Point the manager at another file and re-derive its sidecar paths."""
+        self._preferences_path = path
+        # Sidecar paths used on every save, derived once per preferences path
+        self._backup_path = path.with_suffix(".json.backup")
+        self._temp_path = path.with_suffix(".json.tmp")
+        self._parent_dir = path.parent
+
+    def __enter__(self) -> "PreferenceManager":
+        """Defer writes until the block exits, so bulk updates touch the disk once.
+
+        Blocks may be nested; pending changes are written when the outermost one exits.
+        """
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Re-enable autosave and write pending changes once the outermost block exits.
+
+        If the block raised, the half-applied changes are discarded instead of written,
+        and the next access re-reads the file.
+        """
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        if exc_type is not None:
+            if self._dirty:
+                self._preferences = None
+                self._disk_signature = None
+                self._dirty = False
+            return
+        self.flush()
+
+    @property
+    def _autosave(self) -> bool:
+        """Whether updates are written immediately (i.e. outside any ``with`` block)."""
+        return self._batch_depth == 0
+
+    def flush(self) -> None:
+        """Write pending in-memory changes to disk, if there are any.
+
+        Raises:
+            PreferenceSaveError: If preferences cannot be saved
+        """
+        if self._dirty and self._preferences is not None:
+            self.save_preferences(self._preferences)
+
+    def load_preferences(
+        self, create_if_missing: bool = True, force: bool = False
+    ) -> UserPreference:
         """Load user preferences from disk.
 
+        If preferences are already cached and the file has not changed since it was
+        last read or written by this manager, the cached instance is returned without
+        re-reading the file.
+
         Args:
             create_if_missing: If True, create default preferences if file doesn't exist
+            force: If True, always re-read the file even when the cache is current
 
         Returns:
             UserPreference instance
@@ -57,6 +209,14 @@ class PreferenceManager:
         Raises:
             PreferenceLoadError: If preferences cannot be loaded and create_if_missing is False
         """
+        if (
+            not force
+            and self._preferences is not None
+            and self._disk_signature is not None
+            and self._file_signature() == self._disk_signature
+        ):
+            return self._preferences
+
         # Ensure config directory exists
         try:
             ensure_config_dir_exists()
@@ -75,34 +235,23 @@ class PreferenceManager:
 
         # Try to load existing file
         try:
-            with open(self.preferences_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Parse timestamps from ISO format
-            if "last_updated" in data and isinstance(data["last_updated"], str):
-                data["last_updated"] = datetime.fromisoformat(data["last_updated"].rstrip("Z"))
-
-            if "setup_history" in data:
-                for entry in data["setup_history"]:
-                    if "timestamp" in entry and isinstance(entry["timestamp"], str):
-                        entry["timestamp"] = datetime.fromisoformat(entry["timestamp"].rstrip("Z"))
-
-            # Validate with Pydantic model
-            self._preferences = UserPreference(**data)
+            # Stat before reading, so a write racing the read forces a reload next time
+            signature = self._file_signature()
+            # Validate straight from the JSON bytes, without an intermediate dict
+            self._preferences = UserPreference.model_validate_json(
+                self.preferences_path.read_bytes()
+            )
+            self._saved_state = None
+            self._disk_signature = signature
             logger.debug(f"Loaded preferences from {self.preferences_path}")
             return self._preferences
 
-        except json.JSONDecodeError as e:
-            # Invalid JSON - backup and create new
-            logger.warning(f"Invalid JSON in preferences file: {e}")
-            self._backup_corrupted_file()
-            self._preferences = UserPreference()
-            self.save_preferences(self._preferences)
-            return self._preferences
-
         except ValidationError as e:
-            # Schema validation failed - backup and create new
-            logger.warning(f"Preference schema validation failed: {e}")
+            # Invalid JSON or schema validation failed - backup and create new
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                logger.warning(f"Invalid JSON in preferences file: {e}")
+            else:
+                logger.warning(f"Preference schema validation failed: {e}")
             self._backup_corrupted_file()
             self._preferences = UserPreference()
             self.save_preferences(self._preferences)
@@ -132,34 +281,43 @@ class PreferenceManager:
         except RuntimeError as e:
             raise PreferenceSaveError(f"Cannot create config directory: {e}") from e
 
+        # Skip the write, backup and rename if nothing changed since our last save
+        state = preferences.model_dump_json(exclude={"last_updated"})
+        if state == self._saved_state and self._file_signature() == self._disk_signature:
+            logger.debug("Preferences unchanged, skipping save")
+            self._preferences = preferences
+            self._dirty = False
+            return
+
         # Update last_updated timestamp
         preferences.last_updated = datetime.utcnow()
 
         # Create backup of existing file if it exists
         if self.preferences_path.exists():
-            backup_path = self.preferences_path.with_suffix(".json.backup")
+            backup_path = self._backup_path
             try:
-                shutil.copy2(self.preferences_path, backup_path)
+                _link_or_copy(self.preferences_path, backup_path)
                 logger.debug(f"Created backup at {backup_path}")
             except Exception as e:
                 logger.warning(f"Could not create backup: {e}")
 
         # Write to temporary file first (atomic write)
-        temp_path = self.preferences_path.with_suffix(".json.tmp")
+        temp_path = self._temp_path
         try:
-            # Convert to JSON-serializable dict
-            data = preferences.model_dump(mode="json")
+            payload = preferences.model_dump_json(indent=2).encode("utf-8")
 
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                f.flush()  # Ensure data is written
+            _write_durably(temp_path, payload)
 
-            # Atomic rename (overwrites existing file)
-            temp_path.replace(self.preferences_path)
+            # Atomic rename (overwrites existing file), then persist the rename itself
+            os.replace(temp_path, self.preferences_path)
+            _fsync_directory(self._parent_dir)
             logger.debug(f"Saved preferences to {self.preferences_path}")
 
             # Update cached instance
             self._preferences = preferences
+            self._dirty = False
+            self._saved_state = state
+            self._disk_signature = self._file_signature()
 
         except PermissionError as e:
             raise PreferenceSaveError(f"Permission denied writing preferences: {e}") from e
@@ -173,6 +331,20 @@ class PreferenceManager:
                     pass
             raise PreferenceSaveError(f"Error saving preferences: {e}") from e
 
+    def _load_for_update(self) -> UserPreference:
+        """Return the preferences to modify, keeping unsaved changes while writes are deferred."""
+        if not self._autosave and self._preferences is not None:
+            return self._preferences
+        return self.load_preferences()
+
+    def _commit(self, preferences: UserPreference) -> None:
+        """Save preferences now, or mark them dirty while writes are deferred."""
+        if self._autosave:
+            self.save_preferences(preferences)
+        else:
+            self._preferences = preferences
+            self._dirty = True
+
     def update_preference(self, key: str, value: Any) -> None:
         """Update a single preference value.
 
@@ -185,13 +357,13 @@ class PreferenceManager:
             PreferenceSaveError: If updated preferences cannot be saved
             ValueError: If key is invalid or value fails validation
         """
-        # Load current preferences
-        prefs = self.load_preferences()
-
-        # Validate key exists in model
-        if not hasattr(prefs, key):
+        # Validate key exists in model (before touching disk)
+        if key not in _VALID_PREF_KEYS:
             raise ValueError(f"Invalid preference key: {key}")
 
+        # Load current preferences
+        prefs = self._load_for_update()
+
         # Set new value (Pydantic will validate on assignment)
         try:
             setattr(prefs, key, value)
@@ -199,7 +371,7 @@ class PreferenceManager:
             raise ValueError(f"Invalid value for {key}: {e}") from e
 
         # Save updated preferences
-        self.save_preferences(prefs)
+        self._commit(prefs)
         logger.debug(f"Updated preference {key} = {value}")
 
     def add_setup_history(
@@ -223,7 +395,7 @@ class PreferenceManager:
             success: Whether setup succeeded
             duration_seconds: Setup duration in seconds
         """
-        prefs = self.load_preferences()
+        prefs = self._load_for_update()
 
         entry = SetupHistoryEntry(
             timestamp=datetime.utcnow(),
@@ -237,7 +409,7 @@ class PreferenceManager:
         )
 
         prefs.add_to_history(entry)
-        self.save_preferences(prefs)
+        self._commit(prefs)
         logger.info(f"Added setup history entry: {setup_type_slug} at {project_path}")
 
     def update_after_setup(
@@ -263,7 +435,7 @@ class PreferenceManager:
             success: Whether setup succeeded
             duration_seconds: Setup duration in seconds
         """
-        prefs = self.load_preferences()
+        prefs = self._load_for_update()
 
         # Update preferences
         prefs.update_preferred_manager(package_manager)
@@ -284,7 +456,7 @@ class PreferenceManager:
         )
         prefs.add_to_history(entry)
 
-        self.save_preferences(prefs)
+        self._commit(prefs)
         logger.info(f"Updated preferences after setup: {setup_type_slug}")
 
     def reset_to_defaults(self) -> None:
@@ -297,7 +469,9 @@ class PreferenceManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = self.preferences_path.with_suffix(f".json.backup_{timestamp}")
             try:
-                shutil.copy2(self.preferences_path, backup_path)
+                _link_or_copy(self.preferences_path, backup_path)
+                # The backup is a hardlink, so the save below must really replace the file
+                self._saved_state = None
                 logger.info(f"Created backup before reset: {backup_path}")
             except Exception as e:
                 logger.warning(f"Could not create backup: {e}")
@@ -307,6 +481,20 @@ class PreferenceManager:
         self.save_preferences(default_prefs)
         logger.info("Reset preferences to defaults")
 
+    def _file_signature(self) -> Optional[Tuple[int, int, int, int]]:
+        """Return the preferences file's (inode, ctime_ns, mtime_ns, size), or None if missing.
+
+        The inode and ctime change on every ``os.replace``/``os.link``, which catches
+        atomic rewrites by other processes. An in-place edit that keeps the size and lands
+        within the filesystem's timestamp granularity can still go unnoticed; pass
+        ``force=True`` to ``load_preferences`` when that matters.
+        """
+        try:
+            stat = self.preferences_path.stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_ctime_ns, stat.st_mtime_ns, stat.st_size
+
     def _backup_corrupted_file(self) -> None:
         """Backup corrupted preferences file with timestamp."""
         if not self.preferences_path.exists():
@@ -316,7 +504,9 @@ class PreferenceManager:
         backup_path = self.preferences_path.with_suffix(f".json.corrupted_{timestamp}")
 
         try:
-            shutil.copy2(self.preferences_path, backup_path)
+            _link_or_copy(self.preferences_path, backup_path)
+            # The backup is a hardlink, so the next save must really replace the file
+            self._saved_state = None
             logger.info(f"Backed up corrupted file to {backup_path}")
         except Exception as e:
             logger.warning(f"Could not backup corrupted file: {e}")
@@ -327,9 +517,10 @@ class PreferenceManager:
         Returns:
             Current UserPreference instance
         """
-        if self._preferences is None:
-            self._preferences = self.load_preferences()
-        return self._preferences
+        # Cached fast path: no stat() or read once preferences are in memory
+        if self._preferences is not None:
+            return self._preferences
+        return self.load_preferences()
 
     @property
     def preferences(self) -> UserPreference:
@@ -1,6 +1,7 @@
 """Main Typer application entry point."""
 
 import logging
+from itertools import islice
 from typing import Optional
 
 import typer
@@ -101,7 +102,7 @@ def preferences(
     """Manage user preferences."""
     from typysetup.core import PreferenceManager
 
-    pref_manager = PreferenceManager()
+    pref_manager = PreferenceManager.default()
 
     if show:
         try:
@@ -143,7 +144,8 @@ def preferences(
                 history_table.add_column("Duration", style="blue", width=10)
 
                 # Show last 10 entries
-                for entry in prefs.setup_history[-10:]:
+                start = max(len(prefs.setup_history) - 10, 0)
+                for entry in islice(prefs.setup_history, start, None):
                     date_str = entry.timestamp.strftime("%Y-%m-%d %H:%M")
                     status = "[green]Success[/green]" if entry.success else "[red]Failed[/red]"
                     duration = f"{entry.duration_seconds:.1f}s" if entry.duration_seconds else "N/A"
@@ -243,7 +245,7 @@ def history(
     """Show recent setup history."""
     from typysetup.core import PreferenceManager
 
-    pref_manager = PreferenceManager()
+    pref_manager = PreferenceManager.default()
 
     try:
         prefs = pref_manager.load_preferences()
@@ -271,12 +273,9 @@ def history(
         history_table.add_column("Duration", style="dim", width=10)
 
         # Show last N entries (reversed to show newest first)
-        history_list = prefs.setup_history if prefs.setup_history else []
+        recent_entries = reversed(prefs.setup_history)
         if limit and limit > 0:
-            sliced_history = history_list[-limit:]
-        else:
-            sliced_history = history_list
-        recent_entries = list(reversed(sliced_history))
+            recent_entries = islice(recent_entries, limit)
 
         for entry in recent_entries:
             date_str = entry.timestamp.strftime("%Y-%m-%d %H:%M")
@@ -1,10 +1,25 @@
 """DependencyGroup model for organizing dependencies by category."""
 
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Basic pip format: name, optional [extras], optional version spec
+_PACKAGE_SPEC_RE = re.compile(r"^[a-zA-Z0-9_\-\.]+(\[[a-zA-Z0-9_,\-]+\])?([><=!~\*\+]+.+)?$")
+# Leading package name, before any extras or version operator
+_PACKAGE_NAME_RE = re.compile(r"^([a-zA-Z0-9_\-\.]+)")
+
+# Descriptions used when a well-known group does not provide its own
+_DEFAULT_GROUP_DESCRIPTIONS: Dict[str, str] = {
+    "core": "Core dependencies required for basic functionality",
+    "dev": "Development and testing dependencies",
+    "optional": "Optional dependencies for enhanced functionality",
+    "testing": "Testing and quality assurance tools",
+    "typing": "Type checking and validation tools",
+    "docs": "Documentation generation tools",
+}
+
 
 class DependencyGroup(BaseModel):
     """Represents a group of related dependencies within a setup type.
@@ -45,8 +60,7 @@ class DependencyGroup(BaseModel):
 
         for pkg in v:
             # Check basic pip format: name or name[extras] or name>=version
-            # Pattern: alphanumeric/underscore/hyphen, optional extras, optional version spec
-            if not re.match(r"^[a-zA-Z0-9_\-\.]+(\[[a-zA-Z0-9_,\-]+\])?([><=!~\*\+]+.+)?$", pkg):
+            if not _PACKAGE_SPEC_RE.match(pkg):
                 raise ValueError(
                     f"Invalid package format: {pkg}. "
                     "Expected pip format like 'package', 'package[extra]', or 'package>=1.0'"
@@ -62,7 +76,7 @@ class DependencyGroup(BaseModel):
         names = []
         for pkg in self.packages:
             # Extract name part before [, >, <, =, !, ~, or space
-            match = re.match(r"^([a-zA-Z0-9_\-\.]+)", pkg)
+            match = _PACKAGE_NAME_RE.match(pkg)
             if match:
                 names.append(match.group(1))
         return names
@@ -96,15 +110,9 @@ class DependencyGroup(BaseModel):
             return self.description
 
         # Generate default description based on group name
-        defaults = {
-            "core": "Core dependencies required for basic functionality",
-            "dev": "Development and testing dependencies",
-            "optional": "Optional dependencies for enhanced functionality",
-            "testing": "Testing and quality assurance tools",
-            "typing": "Type checking and validation tools",
-            "docs": "Documentation generation tools",
-        }
-        return defaults.get(self.group_name, f"{self.group_name.title()} dependencies")
+        return _DEFAULT_GROUP_DESCRIPTIONS.get(
+            self.group_name, f"{self.group_name.title()} dependencies"
+        )
 
     def to_installable_format(self) -> str:
         """Get packages in a format suitable for passing to package managers.
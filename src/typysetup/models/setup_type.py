@@ -46,7 +46,7 @@ class SetupType(BaseModel):
         ..., description="Minimum Python version required (e.g., '3.8+', '3.10-3.12')"
     )
     supported_managers: List[str] = Field(
-        ..., min_items=1, description="Package managers available for this type"
+        ..., min_length=1, description="Package managers available for this type"
     )
     vscode_settings: Optional[Dict[str, Any]] = Field(
         default=None, description="VSCode workspace settings to apply"
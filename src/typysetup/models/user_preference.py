@@ -1,10 +1,21 @@
 """UserPreference data model for preference persistence."""
 
+from collections import deque
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Deque, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
+MAX_HISTORY_ENTRIES = 20
+MAX_PREFERRED_SETUP_TYPES = 10
+
+
+def _parse_iso_timestamp(value: Any) -> Any:
+    """Parse an ISO timestamp written with a trailing Z back to a naive datetime."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.rstrip("Z"))
+    return value
+
 
 class SetupHistoryEntry(BaseModel):
     """Record of a setup operation."""
@@ -20,6 +31,12 @@ class SetupHistoryEntry(BaseModel):
     success: bool = Field(..., description="Whether setup succeeded")
     duration_seconds: Optional[float] = Field(default=None, description="Setup duration")
 
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def parse_timestamp(cls, v: Any) -> Any:
+        """Parse ISO timestamps with the Z suffix written by the serializer."""
+        return _parse_iso_timestamp(v)
+
     @field_serializer("timestamp")
     def serialize_timestamp(self, value: datetime) -> str:
         """Serialize datetime to ISO format with Z suffix."""
@@ -40,8 +57,9 @@ class UserPreference(BaseModel):
     preferred_setup_types: List[str] = Field(
         default_factory=list, description="Recently/favorite setup types"
     )
-    setup_history: List[SetupHistoryEntry] = Field(
-        default_factory=list, description="Past setup operations"
+    setup_history: Deque[SetupHistoryEntry] = Field(
+        default_factory=lambda: deque(maxlen=MAX_HISTORY_ENTRIES),
+        description="Past setup operations",
     )
     vscode_config_merge_mode: str = Field(
         default="merge", description="How to handle existing VSCode config"
@@ -52,6 +70,12 @@ class UserPreference(BaseModel):
         default_factory=datetime.utcnow, description="Last modification timestamp"
     )
 
+    @field_validator("last_updated", mode="before")
+    @classmethod
+    def parse_last_updated(cls, v: Any) -> Any:
+        """Parse ISO timestamps with the Z suffix written by the serializer."""
+        return _parse_iso_timestamp(v)
+
     @field_serializer("last_updated")
     def serialize_last_updated(self, value: datetime) -> str:
         """Serialize datetime to ISO format with Z suffix."""
@@ -76,28 +100,30 @@ class UserPreference(BaseModel):
             raise ValueError(f"Invalid merge mode: {v}. Only 'merge' is currently supported")
         return v
 
-    @field_validator("setup_history", mode="before")
+    @field_validator("setup_history", mode="after")
     @classmethod
-    def limit_history(cls, v: List[SetupHistoryEntry]) -> List[SetupHistoryEntry]:
-        """Limit setup history to last 20 entries."""
-        if len(v) > 20:
-            return v[-20:]  # Keep last 20 entries
-        return v
+    def limit_history(cls, v: Deque[SetupHistoryEntry]) -> Deque[SetupHistoryEntry]:
+        """Bound setup history to the last 20 entries."""
+        # Validation builds a plain deque, so re-wrap it to enforce the cap
+        return deque(v, maxlen=MAX_HISTORY_ENTRIES)
 
     def add_to_history(self, entry: SetupHistoryEntry) -> None:
         """Add an entry to setup history, maintaining the 20-entry limit."""
-        self.setup_history.append(entry)
-        if len(self.setup_history) > 20:
-            self.setup_history = self.setup_history[-20:]
+        self.setup_history.append(entry)  # Bounded deque drops the oldest entry
         self.last_updated = datetime.utcnow()
 
     def add_preferred_setup_type(self, slug: str) -> None:
         """Add a setup type to preferred list, removing if already present."""
-        if slug in self.preferred_setup_types:
-            self.preferred_setup_types.remove(slug)
-        self.preferred_setup_types.insert(0, slug)  # Add to beginning
-        if len(self.preferred_setup_types) > 10:
-            self.preferred_setup_types = self.preferred_setup_types[:10]
+        types = self.preferred_setup_types
+        try:
+            index = types.index(slug)
+        except ValueError:
+            types.insert(0, slug)  # Add to beginning
+            del types[MAX_PREFERRED_SETUP_TYPES:]
+        else:
+            # Shift the entries ahead of it back by one in a single slice move
+            types[1 : index + 1] = types[:index]
+            types[0] = slug
         self.last_updated = datetime.utcnow()
 
     def update_preferred_manager(self, manager: str) -> None:
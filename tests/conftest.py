@@ -6,8 +6,10 @@ from pathlib import Path
 from typing import Generator
 
 import pytest
+import yaml
 from typer.testing import CliRunner
 
+from typysetup.core.preference_manager import PreferenceManager
 from typysetup.models import ProjectConfiguration, SetupType, UserPreference
 
 
@@ -31,9 +33,12 @@ def temp_config_dir() -> Generator[Path, None, None]:
         yield Path(tmp_dir)
 
 
-@pytest.fixture
-def sample_setup_type_data() -> dict:
-    """Provide sample setup type configuration data."""
+# Use the libyaml emitter for fixture files when PyYAML was built with it
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _build_sample_setup_type_data() -> dict:
+    """Build a fresh copy of the sample setup type configuration data."""
     return {
         "name": "FastAPI",
         "slug": "fastapi",
@@ -53,6 +58,25 @@ def sample_setup_type_data() -> dict:
     }
 
 
+@pytest.fixture
+def sample_setup_type_data() -> dict:
+    """Provide sample setup type configuration data."""
+    return _build_sample_setup_type_data()
+
+
+@pytest.fixture(scope="session")
+def sample_setup_type_yaml_bytes() -> bytes:
+    """Provide the sample setup type serialized to YAML once per session."""
+    return yaml.dump(_build_sample_setup_type_data(), Dumper=_YamlDumper).encode()
+
+
+@pytest.fixture(scope="session")
+def django_setup_type_yaml_bytes() -> bytes:
+    """Provide a Django variant of the sample setup type serialized to YAML once per session."""
+    data = {**_build_sample_setup_type_data(), "name": "Django", "slug": "django"}
+    return yaml.dump(data, Dumper=_YamlDumper).encode()
+
+
 @pytest.fixture
 def sample_setup_type(sample_setup_type_data: dict) -> SetupType:
     """Provide a sample SetupType instance."""
@@ -97,8 +121,6 @@ def mock_preferences_file(temp_project_dir: Path) -> Path:
 @pytest.fixture
 def mock_setup_type_yaml(temp_config_dir: Path, sample_setup_type_data: dict) -> Path:
     """Provide a mock setup type YAML file."""
-    import yaml
-
     yaml_file = temp_config_dir / "fastapi.yaml"
     with open(yaml_file, "w") as f:
         yaml.dump(sample_setup_type_data, f)
@@ -120,6 +142,20 @@ def mock_vscode_settings(temp_project_dir: Path) -> Path:
     return settings_file
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory, monkeypatch) -> Path:
+    """Point the home directory at a throwaway path for every test.
+
+    Keeps preferences and history out of the real ``~/.typysetup`` so parallel
+    workers never share it, and drops any cached default PreferenceManager.
+    """
+    home_dir = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home_dir))
+    monkeypatch.setenv("USERPROFILE", str(home_dir))
+    monkeypatch.setattr(PreferenceManager, "_default_instances", {})
+    return home_dir
+
+
 @pytest.fixture(autouse=True)
 def reset_imports():
     """Reset module imports between tests to avoid caching issues."""
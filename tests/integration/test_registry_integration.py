@@ -1,8 +1,15 @@
 """Integration tests for setup type registry and configuration system."""
 
+from typing import FrozenSet
+
 from typysetup.core import ConfigLoader, SetupTypeRegistry, SetupTypeValidator
 from typysetup.models import SetupTypeBuilder
 
+# Built-in setup type templates shipped in configs/
+EXPECTED_SLUGS: FrozenSet[str] = frozenset(
+    {"fastapi", "django", "data-science", "cli-tool", "async-realtime", "ml-ai"}
+)
+
 
 class TestPhase3Integration:
     """Integration tests for Phase 3 components."""
@@ -27,19 +34,10 @@ class TestPhase3Integration:
     def test_all_six_templates_present_and_valid(self):
         """Test that all 6 setup type templates are present and valid."""
         registry = SetupTypeRegistry()
-        slugs = registry.get_slugs()
-
-        expected = [
-            "fastapi",
-            "django",
-            "data-science",
-            "cli-tool",
-            "async-realtime",
-            "ml-ai",
-        ]
-
-        for slug in expected:
-            assert slug in slugs
+
+        assert set(registry.get_slugs()) == EXPECTED_SLUGS
+
+        for slug in EXPECTED_SLUGS:
             setup_type = registry.get(slug)
             assert setup_type is not None
             result = SetupTypeValidator.validate_setup_type(setup_type)
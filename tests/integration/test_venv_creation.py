@@ -25,6 +25,27 @@ def temp_project_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture
+def fast_venv(monkeypatch):
+    """Replace real venv creation with a minimal on-disk layout.
+
+    For tests that only check path handling and config updates, not a
+    functional interpreter.
+    """
+
+    def fake_create(self, env_dir):
+        env_dir = Path(env_dir)
+        env_dir.mkdir(parents=True, exist_ok=True)
+        (env_dir / "pyvenv.cfg").touch()
+        python_exe = get_venv_python_executable(env_dir)
+        python_exe.parent.mkdir(parents=True, exist_ok=True)
+        python_exe.touch()
+
+    monkeypatch.setattr("venv.EnvBuilder.create", fake_create)
+    monkeypatch.setattr(VirtualEnvironmentManager, "validate_venv_executable", lambda *_: True)
+    monkeypatch.setattr(VirtualEnvironmentManager, "validate_pip_installed", lambda *_: True)
+
+
 @pytest.fixture
 def sample_project_config(temp_project_dir):
     """Create a sample ProjectConfiguration."""
@@ -138,7 +159,9 @@ class TestVenvCreationIntegration:
         assert result.returncode == 0
         assert "pip" in result.stdout.lower()
 
-    def test_venv_config_updated(self, venv_manager, temp_project_dir, sample_project_config):
+    def test_venv_config_updated(
+        self, venv_manager, temp_project_dir, sample_project_config, fast_venv
+    ):
         """Test that ProjectConfiguration is updated after venv creation."""
         original_venv_path = sample_project_config.venv_path
         original_python_exe = sample_project_config.python_executable
@@ -194,7 +217,7 @@ class TestVenvCreationIntegration:
         assert result.returncode == 0
 
     def test_multiple_venv_in_same_project(
-        self, venv_manager, temp_project_dir, sample_project_config
+        self, venv_manager, temp_project_dir, sample_project_config, fast_venv
     ):
         """Test creating multiple venv instances (one per directory)."""
         major, minor = sys.version_info.major, sys.version_info.minor
@@ -244,7 +267,9 @@ class TestVenvCreationIntegration:
         assert (Path(config1.venv_path)).exists()
         assert (Path(config2.venv_path)).exists()
 
-    def test_venv_in_nested_directory(self, venv_manager, temp_project_dir, sample_project_config):
+    def test_venv_in_nested_directory(
+        self, venv_manager, temp_project_dir, sample_project_config, fast_venv
+    ):
         """Test creating venv in nested directory structure."""
         nested_path = temp_project_dir / "parent" / "child" / "project"
         nested_path.mkdir(parents=True)
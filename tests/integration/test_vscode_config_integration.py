@@ -1,228 +1,166 @@
 """Integration tests for VSCode config generation with SetupOrchestrator."""
 
-import json
-import tempfile
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import patch
 
+import orjson
 import pytest
 
 from typysetup.commands.setup_orchestrator import SetupOrchestrator
-from typysetup.core import ConfigLoader
+from typysetup.core import ConfigLoader, PreferenceManager
+from typysetup.models import DependencySelection, ProjectConfiguration, ProjectMetadata
 
 
-@pytest.fixture
+def _read_json(path: Path):
+    """Parse a generated JSON file straight from its bytes."""
+    return orjson.loads(path.read_bytes())
+
+
+@pytest.fixture(scope="class")
 def config_loader():
     """Create a ConfigLoader for testing."""
     return ConfigLoader()
 
 
-@pytest.fixture
-def orchestrator(config_loader):
-    """Create a SetupOrchestrator for testing."""
-    return SetupOrchestrator(config_loader=config_loader)
-
-
-class TestVSCodeConfigIntegration:
-    """Integration tests for VSCode config generation."""
-
-    def test_generate_vscode_config_phase5(self, orchestrator, config_loader):
-        """Test Phase 5: Generate VSCode configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
+@pytest.fixture(scope="session")
+def fastapi_setup_type():
+    """Load the fastapi setup type once; tests only read it."""
+    return ConfigLoader().load_setup_type("fastapi")
 
-            # Load setup type
-            setup_type = config_loader.load_setup_type("fastapi")
-            assert setup_type is not None
 
-            # Create project config
-            from typysetup.models import ProjectConfiguration
-
-            project_config = ProjectConfiguration(
-                project_path=str(project_path),
-                setup_type_slug="fastapi",
-                python_version="3.10.5",
-                python_executable=str(project_path / "venv" / "bin" / "python"),
-                package_manager="uv",
-                venv_path=str(project_path / "venv"),
-                selected_extensions=["ms-python.vscode-pylance"],
-            )
-
-            # Generate VSCode config
-            result = orchestrator._generate_vscode_config()
-            orchestrator.setup_type = setup_type
-            orchestrator.project_path = project_path
-            orchestrator.project_config = project_config
-
-            result = orchestrator._generate_vscode_config()
-
-            # Verify files were created
-            vscode_dir = project_path / ".vscode"
-            assert vscode_dir.exists()
-            assert (vscode_dir / "settings.json").exists()
-            assert (vscode_dir / "extensions.json").exists()
-            assert (vscode_dir / "launch.json").exists()
+@pytest.fixture
+def make_project_config(tmp_path):
+    """Build ProjectConfiguration instances from one validated template."""
+    base = ProjectConfiguration(
+        project_path=str(tmp_path),
+        setup_type_slug="fastapi",
+        python_version="3.10.5",
+        python_executable=str(tmp_path / "venv" / "bin" / "python"),
+        package_manager="uv",
+        venv_path=str(tmp_path / "venv"),
+    )
 
-    def test_vscode_config_contains_setup_settings(self, orchestrator, config_loader):
-        """Test that VSCode config includes setup type settings."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
+    def _make(**overrides):
+        return base.model_copy(update=overrides)
 
-            setup_type = config_loader.load_setup_type("fastapi")
-            from typysetup.models import ProjectConfiguration
+    return _make
 
-            project_config = ProjectConfiguration(
-                project_path=str(project_path),
-                setup_type_slug="fastapi",
-                python_version="3.10.5",
-                python_executable=str(project_path / "venv" / "bin" / "python"),
-                package_manager="uv",
-                venv_path=str(project_path / "venv"),
-            )
 
-            orchestrator.setup_type = setup_type
-            orchestrator.project_path = project_path
-            orchestrator.project_config = project_config
+@pytest.fixture(scope="class")
+def orchestrator(config_loader, tmp_path_factory):
+    """Create a SetupOrchestrator shared by the tests of a class.
 
-            orchestrator._generate_vscode_config()
+    Class-scoped fixtures run before the per-test home isolation, so the orchestrator
+    gets its own PreferenceManager instead of the default one for the real home.
+    """
+    preference_manager = PreferenceManager(tmp_path_factory.mktemp("prefs") / "preferences.json")
+    with patch.object(PreferenceManager, "default", return_value=preference_manager):
+        return SetupOrchestrator(config_loader=config_loader)
 
-            # Verify settings include setup type values
-            settings_file = project_path / ".vscode" / "settings.json"
-            settings = json.loads(settings_file.read_text())
-            assert "python.linting.enabled" in settings
 
-    def test_vscode_config_includes_selected_extensions(self, orchestrator, config_loader):
-        """Test that VSCode config includes selected extensions."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
+@pytest.fixture(autouse=True)
+def reset_orchestrator(orchestrator):
+    """Clear wizard state left behind by the previous test."""
+    orchestrator.reset()
 
-            setup_type = config_loader.load_setup_type("fastapi")
-            from typysetup.models import ProjectConfiguration
 
-            project_config = ProjectConfiguration(
-                project_path=str(project_path),
-                setup_type_slug="fastapi",
-                python_version="3.10.5",
-                python_executable=str(project_path / "venv" / "bin" / "python"),
-                package_manager="uv",
-                venv_path=str(project_path / "venv"),
-                selected_extensions=["charliermarsh.ruff", "ms-python.vscode-pylance"],
-            )
+class TestVSCodeConfigIntegration:
+    """Integration tests for VSCode config generation."""
 
-            orchestrator.setup_type = setup_type
-            orchestrator.project_path = project_path
-            orchestrator.project_config = project_config
+    def test_generate_vscode_config_phase5(
+        self, orchestrator, fastapi_setup_type, make_project_config, tmp_path
+    ):
+        """Test Phase 5: Generate settings, extensions and launch configuration."""
+        project_path = tmp_path
 
-            orchestrator._generate_vscode_config()
+        # Create project config
+        project_config = make_project_config(
+            selected_extensions=["charliermarsh.ruff", "ms-python.vscode-pylance"]
+        )
 
-            # Verify extensions include both setup + selected
-            ext_file = project_path / ".vscode" / "extensions.json"
-            extensions = json.loads(ext_file.read_text())
-            recs = extensions["recommendations"]
-            assert "charliermarsh.ruff" in recs
-            assert "ms-python.vscode-pylance" in recs
+        orchestrator.setup_type = fastapi_setup_type
+        orchestrator.project_path = project_path
+        orchestrator.project_config = project_config
 
-    def test_vscode_config_merges_with_existing(self, orchestrator, config_loader):
+        # Generate VSCode config
+        result = orchestrator._generate_vscode_config()
+        assert result is True
+
+        # Verify files were created
+        vscode_dir = project_path / ".vscode"
+        assert vscode_dir.exists()
+        assert (vscode_dir / "settings.json").exists()
+        assert (vscode_dir / "extensions.json").exists()
+        assert (vscode_dir / "launch.json").exists()
+
+        # Verify settings include setup type values
+        settings = _read_json(vscode_dir / "settings.json")
+        assert "python.linting.enabled" in settings
+
+        # Verify extensions include both setup + selected
+        recs = _read_json(vscode_dir / "extensions.json")["recommendations"]
+        assert "charliermarsh.ruff" in recs
+        assert "ms-python.vscode-pylance" in recs
+
+        # Verify launch.json structure
+        launch = _read_json(vscode_dir / "launch.json")
+        assert launch["version"] == "0.2.0"
+        assert "configurations" in launch
+        assert isinstance(launch["configurations"], list)
+
+    def test_vscode_config_merges_with_existing(
+        self, orchestrator, fastapi_setup_type, make_project_config, tmp_path
+    ):
         """Test that VSCode config merges with existing settings."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            vscode_dir = project_path / ".vscode"
-            vscode_dir.mkdir()
-
-            # Create existing settings with settings NOT in fastapi setup type
-            existing_settings = {
-                "editor.wordWrap": "on",  # Not in fastapi setup type
-                "[javascript]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
-            }
-            (vscode_dir / "settings.json").write_text(json.dumps(existing_settings))
-
-            setup_type = config_loader.load_setup_type("fastapi")
-            from typysetup.models import ProjectConfiguration
-
-            project_config = ProjectConfiguration(
-                project_path=str(project_path),
-                setup_type_slug="fastapi",
-                python_version="3.10.5",
-                python_executable=str(project_path / "venv" / "bin" / "python"),
-                package_manager="uv",
-                venv_path=str(project_path / "venv"),
-            )
-
-            orchestrator.setup_type = setup_type
-            orchestrator.project_path = project_path
-            orchestrator.project_config = project_config
-
-            orchestrator._generate_vscode_config()
-
-            # Verify merge
-            settings = json.loads((vscode_dir / "settings.json").read_text())
-            assert settings["editor.wordWrap"] == "on"  # Existing preserved (not in setup)
-            assert settings["editor.formatOnSave"] is True  # New from setup (takes precedence)
-            assert settings["python.linting.enabled"] is True  # New from setup
-
-    def test_vscode_config_creates_backup(self, orchestrator, config_loader):
+        project_path = tmp_path
+        vscode_dir = project_path / ".vscode"
+        vscode_dir.mkdir()
+
+        # Create existing settings with settings NOT in fastapi setup type
+        existing_settings = {
+            "editor.wordWrap": "on",  # Not in fastapi setup type
+            "[javascript]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
+        }
+        (vscode_dir / "settings.json").write_bytes(orjson.dumps(existing_settings))
+
+        project_config = make_project_config()
+
+        orchestrator.setup_type = fastapi_setup_type
+        orchestrator.project_path = project_path
+        orchestrator.project_config = project_config
+
+        orchestrator._generate_vscode_config()
+
+        # Verify merge
+        settings = _read_json(vscode_dir / "settings.json")
+        assert settings["editor.wordWrap"] == "on"  # Existing preserved (not in setup)
+        assert settings["editor.formatOnSave"] is True  # New from setup (takes precedence)
+        assert settings["python.linting.enabled"] is True  # New from setup
+
+    def test_vscode_config_creates_backup(
+        self, orchestrator, fastapi_setup_type, make_project_config, tmp_path
+    ):
         """Test that existing config files are backed up."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-            vscode_dir = project_path / ".vscode"
-            vscode_dir.mkdir()
+        project_path = tmp_path
+        vscode_dir = project_path / ".vscode"
+        vscode_dir.mkdir()
 
-            # Create existing settings
-            existing_settings = {"existing": True}
-            settings_file = vscode_dir / "settings.json"
-            settings_file.write_text(json.dumps(existing_settings))
+        # Create existing settings
+        existing_settings = {"existing": True}
+        settings_file = vscode_dir / "settings.json"
+        settings_file.write_bytes(orjson.dumps(existing_settings))
 
-            setup_type = config_loader.load_setup_type("fastapi")
-            from typysetup.models import ProjectConfiguration
+        project_config = make_project_config()
 
-            project_config = ProjectConfiguration(
-                project_path=str(project_path),
-                setup_type_slug="fastapi",
-                python_version="3.10.5",
-                python_executable=str(project_path / "venv" / "bin" / "python"),
-                package_manager="uv",
-                venv_path=str(project_path / "venv"),
-            )
-
-            orchestrator.setup_type = setup_type
-            orchestrator.project_path = project_path
-            orchestrator.project_config = project_config
+        orchestrator.setup_type = fastapi_setup_type
+        orchestrator.project_path = project_path
+        orchestrator.project_config = project_config
 
-            orchestrator._generate_vscode_config()
+        orchestrator._generate_vscode_config()
 
-            # Verify backup exists
-            backups = list(vscode_dir.glob("settings.json.backup.*"))
-            assert len(backups) > 0
-
-    def test_vscode_launch_config_generation(self, orchestrator, config_loader):
-        """Test that launch.json is properly generated."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project_path = Path(tmpdir)
-
-            setup_type = config_loader.load_setup_type("fastapi")
-            from typysetup.models import ProjectConfiguration
-
-            project_config = ProjectConfiguration(
-                project_path=str(project_path),
-                setup_type_slug="fastapi",
-                python_version="3.10.5",
-                python_executable=str(project_path / "venv" / "bin" / "python"),
-                package_manager="uv",
-                venv_path=str(project_path / "venv"),
-            )
-
-            orchestrator.setup_type = setup_type
-            orchestrator.project_path = project_path
-            orchestrator.project_config = project_config
-
-            orchestrator._generate_vscode_config()
-
-            # Verify launch.json structure
-            launch_file = project_path / ".vscode" / "launch.json"
-            launch = json.loads(launch_file.read_text())
-            assert launch["version"] == "0.2.0"
-            assert "configurations" in launch
-            assert isinstance(launch["configurations"], list)
+        # Verify backup exists
+        assert next(vscode_dir.glob("settings.json.backup.*"), None) is not None
 
     def test_generate_vscode_config_error_handling(self, orchestrator):
         """Test error handling in VSCode config generation."""
@@ -235,51 +173,42 @@ class TestVSCodeConfigIntegration:
         result = orchestrator._generate_vscode_config()
         assert result is False
 
-    def test_full_setup_wizard_with_vscode_phase(self, orchestrator):
+    def test_full_setup_wizard_with_vscode_phase(self, orchestrator, fastapi_setup_type, tmp_path):
         """Test that Phase 5 runs in complete setup wizard."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch.object(orchestrator, "_select_setup_type", return_value=True):
-                with patch.object(orchestrator, "_select_python_version", return_value="3.10"):
-                    with patch.object(orchestrator, "_select_package_manager", return_value="uv"):
-                        with patch.object(orchestrator, "_confirm_setup", return_value=True):
-                            with patch.object(
-                                orchestrator, "_select_dependency_groups"
-                            ) as mock_deps:
-                                with patch.object(
-                                    orchestrator, "_select_vscode_extensions"
-                                ) as mock_ext:
-                                    with patch.object(
-                                        orchestrator, "_collect_project_metadata"
-                                    ) as mock_meta:
-                                        with patch.object(
-                                            orchestrator,
-                                            "_confirm_all_selections",
-                                            return_value=True,
-                                        ):
-                                            from typysetup.models import (
-                                                DependencySelection,
-                                                ProjectMetadata,
-                                            )
-
-                                            # Setup mocks
-                                            orchestrator.setup_type = (
-                                                orchestrator.config_loader.load_setup_type(
-                                                    "fastapi"
-                                                )
-                                            )
-                                            mock_deps.return_value = DependencySelection(
-                                                setup_type_slug="fastapi",
-                                                selected_groups={"core": True},
-                                                all_packages=["fastapi>=0.104"],
-                                            )
-                                            mock_ext.return_value = []
-                                            mock_meta.return_value = ProjectMetadata(
-                                                project_name="test_project"
-                                            )
-
-                                            result = orchestrator.run_setup_wizard(tmpdir)
-
-                                            # Verify Phase 5 ran
-                                            vscode_dir = Path(tmpdir) / ".vscode"
-                                            assert vscode_dir.exists()
-                                            assert (vscode_dir / "settings.json").exists()
+        with ExitStack() as stack:
+            for name, return_value in [
+                ("_select_setup_type", True),
+                ("_select_python_version", "3.10"),
+                ("_select_package_manager", "uv"),
+                ("_confirm_setup", True),
+                ("_confirm_all_selections", True),
+            ]:
+                stack.enter_context(patch.object(orchestrator, name, return_value=return_value))
+            mock_deps = stack.enter_context(patch.object(orchestrator, "_select_dependency_groups"))
+            mock_ext = stack.enter_context(patch.object(orchestrator, "_select_vscode_extensions"))
+            mock_meta = stack.enter_context(patch.object(orchestrator, "_collect_project_metadata"))
+            # Write history through a manager of our own, not the class-shared default
+            stack.enter_context(
+                patch.object(
+                    orchestrator,
+                    "preference_manager",
+                    PreferenceManager(tmp_path / "preferences.json"),
+                )
+            )
+
+            # Setup mocks
+            orchestrator.setup_type = fastapi_setup_type
+            mock_deps.return_value = DependencySelection(
+                setup_type_slug="fastapi",
+                selected_groups={"core": True},
+                all_packages=["fastapi>=0.104"],
+            )
+            mock_ext.return_value = []
+            mock_meta.return_value = ProjectMetadata(project_name="test_project")
+
+            result = orchestrator.run_setup_wizard(str(tmp_path))
+
+        # Verify Phase 5 ran
+        vscode_dir = tmp_path / ".vscode"
+        assert vscode_dir.exists()
+        assert (vscode_dir / "settings.json").exists()
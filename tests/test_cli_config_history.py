@@ -1,16 +1,20 @@
 """Tests for CLI commands: config display and history management."""
 
-import json
-from datetime import UTC, datetime
+from datetime import datetime
 
+import orjson
 import pytest
 from typer.testing import CliRunner
 
 from typysetup.main import app
 from typysetup.models.user_preference import SetupHistoryEntry, UserPreference
+from typysetup.utils.paths import get_preferences_file_path
 
 runner = CliRunner()
 
+# Only needs to pass schema validation; tests never inspect it
+FIXED_TIMESTAMP = "2024-01-01T00:00:00+00:00Z"
+
 
 class TestConfigCommand:
     """Test config command."""
@@ -29,16 +33,15 @@ class TestConfigCommand:
             "package_manager": "uv",
             "venv_path": str(tmp_path / "venv"),
             "status": "success",
-            "created_at": datetime.now(UTC).isoformat() + "Z",
+            "created_at": FIXED_TIMESTAMP,
             "installed_dependencies": [],
         }
 
         config_file = pysetup_dir / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(config_data, f)
+        config_file.write_bytes(orjson.dumps(config_data))
 
         # Run command
-        result = runner.invoke(app, ["config", str(tmp_path)])
+        result = runner.invoke(app, ["config", str(tmp_path)], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Project Configuration" in result.stdout
@@ -47,14 +50,14 @@ class TestConfigCommand:
 
     def test_config_show_nonexistent_project(self, tmp_path):
         """Test showing config for project without config."""
-        result = runner.invoke(app, ["config", str(tmp_path)])
+        result = runner.invoke(app, ["config", str(tmp_path)], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "No TyPySetup configuration found" in result.stdout
 
     def test_config_show_invalid_path(self):
         """Test showing config for invalid path."""
-        result = runner.invoke(app, ["config", "/nonexistent/path"])
+        result = runner.invoke(app, ["config", "/nonexistent/path"], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "not found" in result.stdout
@@ -72,7 +75,7 @@ class TestConfigCommand:
             "package_manager": "pip",
             "venv_path": str(tmp_path / "venv"),
             "status": "success",
-            "created_at": datetime.now(UTC).isoformat() + "Z",
+            "created_at": FIXED_TIMESTAMP,
             "installed_dependencies": [],
             "project_metadata": {
                 "project_name": "my-flask-app",
@@ -83,10 +86,9 @@ class TestConfigCommand:
         }
 
         config_file = pysetup_dir / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(config_data, f)
+        config_file.write_bytes(orjson.dumps(config_data))
 
-        result = runner.invoke(app, ["config", str(tmp_path)])
+        result = runner.invoke(app, ["config", str(tmp_path)], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "my-flask-app" in result.stdout
@@ -105,7 +107,7 @@ class TestConfigCommand:
             "package_manager": "uv",
             "venv_path": str(tmp_path / "venv"),
             "status": "success",
-            "created_at": datetime.now(UTC).isoformat() + "Z",
+            "created_at": FIXED_TIMESTAMP,
             "installed_dependencies": [
                 {
                     "name": "fastapi",
@@ -124,67 +126,90 @@ class TestConfigCommand:
         }
 
         config_file = pysetup_dir / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(config_data, f)
+        config_file.write_bytes(orjson.dumps(config_data))
 
-        result = runner.invoke(app, ["config", str(tmp_path)])
+        result = runner.invoke(app, ["config", str(tmp_path)], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Installed Dependencies" in result.stdout
         assert "3" in result.stdout  # Total dependencies
 
 
-class TestHistoryCommand:
-    """Test history command."""
+@pytest.fixture
+def home_with_prefs(tmp_path, monkeypatch):
+    """Point the home directory at tmp_path and return its preferences file path.
+
+    The config directory is created; the preferences file is not.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    prefs_file = get_preferences_file_path()
+    prefs_file.parent.mkdir(parents=True, exist_ok=True)
+    return prefs_file
+
+
+@pytest.fixture(scope="class")
+def history_home(tmp_path_factory):
+    """Create a home directory whose preferences hold two history entries.
+
+    Built once per class; the history tests only read it.
+    """
+    home_dir = tmp_path_factory.mktemp("history")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home_dir))
+        mp.setenv("USERPROFILE", str(home_dir))
+        prefs_file = get_preferences_file_path()
+    prefs_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Create preferences with history
+    prefs = UserPreference()
+    prefs.add_to_history(
+        SetupHistoryEntry(
+            timestamp=datetime(2024, 1, 15, 10, 30),
+            setup_type_slug="fastapi",
+            project_path="/home/user/projects/api",
+            project_name="my-api",
+            python_version="3.11",
+            package_manager="uv",
+            success=True,
+            duration_seconds=25.5,
+        )
+    )
+    prefs.add_to_history(
+        SetupHistoryEntry(
+            timestamp=datetime(2024, 1, 16, 14, 20),
+            setup_type_slug="flask",
+            project_path="/home/user/projects/web",
+            project_name="my-web-app",
+            python_version="3.10",
+            package_manager="pip",
+            success=False,
+            duration_seconds=15.2,
+        )
+    )
 
-    @pytest.fixture
-    def preferences_with_history(self, tmp_path, monkeypatch):
-        """Create preferences file with history."""
-        # Setup preferences directory
-        config_dir = tmp_path / ".config" / "typysetup"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        prefs_file = config_dir / "preferences.json"
+    # Save to file
+    prefs_file.write_bytes(orjson.dumps(prefs.model_dump(mode="json")))
 
-        # Monkeypatch the preferences path
-        monkeypatch.setenv("HOME", str(tmp_path))
-        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    return home_dir, prefs_file
 
-        # Create preferences with history
-        prefs = UserPreference()
-        prefs.add_to_history(
-            SetupHistoryEntry(
-                timestamp=datetime(2024, 1, 15, 10, 30),
-                setup_type_slug="fastapi",
-                project_path="/home/user/projects/api",
-                project_name="my-api",
-                python_version="3.11",
-                package_manager="uv",
-                success=True,
-                duration_seconds=25.5,
-            )
-        )
-        prefs.add_to_history(
-            SetupHistoryEntry(
-                timestamp=datetime(2024, 1, 16, 14, 20),
-                setup_type_slug="flask",
-                project_path="/home/user/projects/web",
-                project_name="my-web-app",
-                python_version="3.10",
-                package_manager="pip",
-                success=False,
-                duration_seconds=15.2,
-            )
-        )
 
-        # Save to file
-        with open(prefs_file, "w") as f:
-            json.dump(prefs.model_dump(mode="json"), f)
+@pytest.fixture
+def preferences_with_history(history_home, monkeypatch):
+    """Point the home directory at the shared preferences file with history."""
+    home_dir, prefs_file = history_home
+    monkeypatch.setenv("HOME", str(home_dir))
+    monkeypatch.setenv("USERPROFILE", str(home_dir))
+    return prefs_file
 
-        return prefs_file
+
+class TestHistoryCommand:
+    """Test history command."""
 
     def test_history_with_entries(self, preferences_with_history):
         """Test history command with existing entries."""
-        result = runner.invoke(app, ["history"])
+        result = runner.invoke(app, ["history"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Setup History" in result.stdout
@@ -194,7 +219,7 @@ class TestHistoryCommand:
 
     def test_history_with_limit(self, preferences_with_history):
         """Test history command with custom limit."""
-        result = runner.invoke(app, ["history", "--limit", "1"])
+        result = runner.invoke(app, ["history", "--limit", "1"], catch_exceptions=False)
 
         assert result.exit_code == 0
         # Should only show 1 entry (most recent)
@@ -202,34 +227,26 @@ class TestHistoryCommand:
 
     def test_history_verbose(self, preferences_with_history):
         """Test history command with verbose flag."""
-        result = runner.invoke(app, ["history", "--verbose"])
+        result = runner.invoke(app, ["history", "--verbose"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Python" in result.stdout or "3.11" in result.stdout
         assert "Manager" in result.stdout or "uv" in result.stdout
 
-    def test_history_no_entries(self, tmp_path, monkeypatch):
+    def test_history_no_entries(self, home_with_prefs):
         """Test history command with no entries."""
         # Setup empty preferences
-        config_dir = tmp_path / ".config" / "typysetup"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        prefs_file = config_dir / "preferences.json"
-
-        monkeypatch.setenv("HOME", str(tmp_path))
-        monkeypatch.setenv("USERPROFILE", str(tmp_path))
-
         prefs = UserPreference()
-        with open(prefs_file, "w") as f:
-            json.dump(prefs.model_dump(mode="json"), f)
+        home_with_prefs.write_bytes(orjson.dumps(prefs.model_dump(mode="json")))
 
-        result = runner.invoke(app, ["history"])
+        result = runner.invoke(app, ["history"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "No setup history found" in result.stdout
 
     def test_history_success_and_failed_counts(self, preferences_with_history):
         """Test that history shows success/failed counts."""
-        result = runner.invoke(app, ["history"])
+        result = runner.invoke(app, ["history"], catch_exceptions=False)
 
         assert result.exit_code == 0
         # Should show statistics
@@ -238,21 +255,14 @@ class TestHistoryCommand:
 
     def test_history_duration_display(self, preferences_with_history):
         """Test that history displays duration."""
-        result = runner.invoke(app, ["history"])
+        result = runner.invoke(app, ["history"], catch_exceptions=False)
 
         assert result.exit_code == 0
         # Should show duration in seconds
         assert "25.5s" in result.stdout or "15.2s" in result.stdout
 
-    def test_history_with_long_project_name(self, tmp_path, monkeypatch):
+    def test_history_with_long_project_name(self, home_with_prefs):
         """Test history truncates long project names."""
-        config_dir = tmp_path / ".config" / "typysetup"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        prefs_file = config_dir / "preferences.json"
-
-        monkeypatch.setenv("HOME", str(tmp_path))
-        monkeypatch.setenv("USERPROFILE", str(tmp_path))
-
         prefs = UserPreference()
         prefs.add_to_history(
             SetupHistoryEntry(
@@ -266,10 +276,9 @@ class TestHistoryCommand:
             )
         )
 
-        with open(prefs_file, "w") as f:
-            json.dump(prefs.model_dump(mode="json"), f)
+        home_with_prefs.write_bytes(orjson.dumps(prefs.model_dump(mode="json")))
 
-        result = runner.invoke(app, ["history"])
+        result = runner.invoke(app, ["history"], catch_exceptions=False)
 
         assert result.exit_code == 0
         # Name should be truncated with ...
@@ -277,7 +286,7 @@ class TestHistoryCommand:
 
     def test_history_newest_first(self, preferences_with_history):
         """Test that history shows newest entries first."""
-        result = runner.invoke(app, ["history"])
+        result = runner.invoke(app, ["history"], catch_exceptions=False)
 
         assert result.exit_code == 0
         # flask is newer than fastapi, should appear first in output
@@ -297,7 +306,7 @@ class TestConfigCommandEdgeCases:
         config_file = pysetup_dir / "config.json"
         config_file.write_text("{ invalid json }")
 
-        result = runner.invoke(app, ["config", str(tmp_path)])
+        result = runner.invoke(app, ["config", str(tmp_path)], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "Error" in result.stdout
@@ -314,15 +323,14 @@ class TestConfigCommandEdgeCases:
         }
 
         config_file = pysetup_dir / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(config_data, f)
+        config_file.write_bytes(orjson.dumps(config_data))
 
-        result = runner.invoke(app, ["config", str(tmp_path)])
+        result = runner.invoke(app, ["config", str(tmp_path)], catch_exceptions=False)
 
         assert result.exit_code == 1
         assert "Error" in result.stdout
 
-    def test_config_with_relative_path(self, tmp_path):
+    def test_config_with_relative_path(self, tmp_path, monkeypatch):
         """Test config command with relative path."""
         pysetup_dir = tmp_path / ".typysetup"
         pysetup_dir.mkdir()
@@ -335,38 +343,27 @@ class TestConfigCommandEdgeCases:
             "package_manager": "pip",
             "venv_path": str(tmp_path / "venv"),
             "status": "success",
-            "created_at": datetime.now(UTC).isoformat() + "Z",
+            "created_at": FIXED_TIMESTAMP,
             "installed_dependencies": [],
         }
 
         config_file = pysetup_dir / "config.json"
-        with open(config_file, "w") as f:
-            json.dump(config_data, f)
+        config_file.write_bytes(orjson.dumps(config_data))
 
         # Change to parent directory and use relative path
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path.parent)
-            result = runner.invoke(app, ["config", tmp_path.name])
-            assert result.exit_code == 0
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(tmp_path.parent)
+        result = runner.invoke(app, ["config", tmp_path.name], catch_exceptions=False)
+        assert result.exit_code == 0
 
 
 class TestHistoryCommandEdgeCases:
     """Test edge cases for history command."""
 
-    def test_history_with_missing_preferences_file(self, tmp_path, monkeypatch):
+    def test_history_with_missing_preferences_file(self, home_with_prefs):
         """Test history when preferences file doesn't exist."""
-        config_dir = tmp_path / ".config" / "typysetup"
-        config_dir.mkdir(parents=True, exist_ok=True)
-
-        monkeypatch.setenv("HOME", str(tmp_path))
-        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        assert not home_with_prefs.exists()
 
-        result = runner.invoke(app, ["history"])
+        result = runner.invoke(app, ["history"], catch_exceptions=False)
 
         # Should create default preferences and show no history
         assert result.exit_code == 0
@@ -374,14 +371,14 @@ class TestHistoryCommandEdgeCases:
 
     def test_history_with_zero_limit(self, preferences_with_history):
         """Test history with limit of 0."""
-        result = runner.invoke(app, ["history", "--limit", "0"])
+        result = runner.invoke(app, ["history", "--limit", "0"], catch_exceptions=False)
 
         # Should handle gracefully
         assert result.exit_code == 0
 
     def test_history_with_negative_limit(self, preferences_with_history):
         """Test history with negative limit."""
-        result = runner.invoke(app, ["history", "--limit", "-1"])
+        result = runner.invoke(app, ["history", "--limit", "-1"], catch_exceptions=False)
 
         # Typer should handle validation
         assert result.exit_code != 0 or "history" in result.stdout.lower()
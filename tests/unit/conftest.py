@@ -0,0 +1,13 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _default_which(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Resolve every executable lookup to /usr/bin so unit tests never probe the real PATH.
+
+    Tests that need a tool to be missing override it with
+    ``monkeypatch.setattr("shutil.which", lambda name: None)``.
+    """
+    monkeypatch.setattr("shutil.which", lambda name: f"/usr/bin/{name}")
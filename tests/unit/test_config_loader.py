@@ -1,27 +1,38 @@
 """Tests for ConfigLoader."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from typysetup.core.config_loader import ConfigLoader, ConfigLoadError
 from typysetup.models import SetupType
 
+# Use the libyaml emitter for fixture files when PyYAML was built with it
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@pytest.fixture(scope="module")
+def shared_loader(
+    tmp_path_factory: pytest.TempPathFactory,
+    sample_setup_type_yaml_bytes: bytes,
+    django_setup_type_yaml_bytes: bytes,
+) -> ConfigLoader:
+    """Provide one loader over the fastapi and django fixtures for read-only tests."""
+    config_dir = tmp_path_factory.mktemp("shared_configs")
+    (config_dir / "fastapi.yaml").write_bytes(sample_setup_type_yaml_bytes)
+    (config_dir / "django.yaml").write_bytes(django_setup_type_yaml_bytes)
+    return ConfigLoader(config_dir)
+
 
 @pytest.mark.unit
 class TestConfigLoader:
     """Test ConfigLoader class."""
 
-    def test_load_setup_type_valid(self, temp_config_dir: Path, sample_setup_type_data: dict):
+    def test_load_setup_type_valid(self, shared_loader: ConfigLoader):
         """Test loading a valid setup type configuration."""
-        import yaml
-
-        yaml_file = temp_config_dir / "fastapi.yaml"
-        with open(yaml_file, "w") as f:
-            yaml.dump(sample_setup_type_data, f)
-
-        loader = ConfigLoader(temp_config_dir)
-        setup_type = loader.load_setup_type("fastapi")
+        setup_type = shared_loader.load_setup_type("fastapi")
 
         assert setup_type.name == "FastAPI"
         assert setup_type.slug == "fastapi"
@@ -37,50 +48,40 @@ class TestConfigLoader:
         assert "not found" in str(exc_info.value).lower()
 
     def test_load_setup_type_invalid_yaml(self, temp_config_dir: Path):
-        """Test loading an invalid YAML file."""
-        yaml_file = temp_config_dir / "invalid.yaml"
-        yaml_file.write_text("invalid: yaml: content: [")
-
+        """Test parsing an invalid YAML document."""
         loader = ConfigLoader(temp_config_dir)
 
         with pytest.raises(ConfigLoadError) as exc_info:
-            loader.load_setup_type("invalid")
+            loader._parse_setup_type_from_bytes(b"invalid: yaml: content: [", "invalid")
 
         assert "yaml" in str(exc_info.value).lower()
 
     def test_load_setup_type_invalid_config(self, temp_config_dir: Path):
-        """Test loading a YAML with invalid configuration."""
-        import yaml
-
-        yaml_file = temp_config_dir / "bad_config.yaml"
+        """Test parsing a YAML document with invalid configuration."""
         invalid_data = {
             "name": "Test",
             "slug": "test",
             # Missing required fields
         }
-        with open(yaml_file, "w") as f:
-            yaml.dump(invalid_data, f)
+        raw = yaml.dump(invalid_data, Dumper=Dumper).encode()
 
         loader = ConfigLoader(temp_config_dir)
 
         with pytest.raises(ConfigLoadError):
-            loader.load_setup_type("bad_config")
+            loader._parse_setup_type_from_bytes(raw, "bad_config")
 
-    def test_load_all_setup_types(self, temp_config_dir: Path, sample_setup_type_data: dict):
+    def test_load_all_setup_types(
+        self,
+        temp_config_dir: Path,
+        sample_setup_type_yaml_bytes: bytes,
+        django_setup_type_yaml_bytes: bytes,
+    ):
         """Test loading all setup types from directory."""
-        import yaml
-
         # Create multiple setup type files
         yaml_file1 = temp_config_dir / "fastapi.yaml"
-        with open(yaml_file1, "w") as f:
-            yaml.dump(sample_setup_type_data, f)
-
-        data2 = sample_setup_type_data.copy()
-        data2["name"] = "Django"
-        data2["slug"] = "django"
+        yaml_file1.write_bytes(sample_setup_type_yaml_bytes)
         yaml_file2 = temp_config_dir / "django.yaml"
-        with open(yaml_file2, "w") as f:
-            yaml.dump(data2, f)
+        yaml_file2.write_bytes(django_setup_type_yaml_bytes)
 
         loader = ConfigLoader(temp_config_dir)
         setup_types = loader.load_all_setup_types()
@@ -101,13 +102,10 @@ class TestConfigLoader:
         error_msg = str(exc_info.value).lower()
         assert "no yaml files" in error_msg or "no valid setup types" in error_msg
 
-    def test_cache_setup_type(self, temp_config_dir: Path, sample_setup_type_data: dict):
+    def test_cache_setup_type(self, temp_config_dir: Path, sample_setup_type_yaml_bytes: bytes):
         """Test that setup types are cached."""
-        import yaml
-
         yaml_file = temp_config_dir / "fastapi.yaml"
-        with open(yaml_file, "w") as f:
-            yaml.dump(sample_setup_type_data, f)
+        yaml_file.write_bytes(sample_setup_type_yaml_bytes)
 
         loader = ConfigLoader(temp_config_dir)
         setup_type1 = loader.load_setup_type("fastapi")
@@ -115,13 +113,28 @@ class TestConfigLoader:
 
         assert setup_type1 is setup_type2  # Same object from cache
 
-    def test_clear_cache(self, temp_config_dir: Path, sample_setup_type_data: dict):
-        """Test clearing the configuration cache."""
-        import yaml
+    def test_cache_hit_skips_file_and_validation(
+        self, temp_config_dir: Path, sample_setup_type_yaml_bytes: bytes
+    ):
+        """Test that a cached setup type is returned without re-reading or re-validating."""
+        yaml_file = temp_config_dir / "fastapi.yaml"
+        yaml_file.write_bytes(sample_setup_type_yaml_bytes)
 
+        loader = ConfigLoader(temp_config_dir)
+        setup_type1 = loader.load_setup_type("fastapi")
+        yaml_file.unlink()
+
+        with patch.object(
+            loader, "_parse_setup_type_from_bytes", side_effect=AssertionError("parsed again")
+        ):
+            setup_type2 = loader.load_setup_type("fastapi")
+
+        assert setup_type1 is setup_type2
+
+    def test_clear_cache(self, temp_config_dir: Path, sample_setup_type_yaml_bytes: bytes):
+        """Test clearing the configuration cache."""
         yaml_file = temp_config_dir / "fastapi.yaml"
-        with open(yaml_file, "w") as f:
-            yaml.dump(sample_setup_type_data, f)
+        yaml_file.write_bytes(sample_setup_type_yaml_bytes)
 
         loader = ConfigLoader(temp_config_dir)
         setup_type1 = loader.load_setup_type("fastapi")
@@ -130,38 +143,16 @@ class TestConfigLoader:
 
         assert setup_type1 is not setup_type2  # Different objects after cache clear
 
-    def test_list_setup_type_slugs(self, temp_config_dir: Path, sample_setup_type_data: dict):
+    def test_list_setup_type_slugs(self, shared_loader: ConfigLoader):
         """Test listing available setup type slugs."""
-        import yaml
-
-        yaml_file1 = temp_config_dir / "fastapi.yaml"
-        with open(yaml_file1, "w") as f:
-            yaml.dump(sample_setup_type_data, f)
-
-        data2 = sample_setup_type_data.copy()
-        data2["slug"] = "django"
-        yaml_file2 = temp_config_dir / "django.yaml"
-        with open(yaml_file2, "w") as f:
-            yaml.dump(data2, f)
-
-        loader = ConfigLoader(temp_config_dir)
-        slugs = loader.list_setup_type_slugs()
+        slugs = shared_loader.list_setup_type_slugs()
 
         assert "fastapi" in slugs
         assert "django" in slugs
 
-    def test_get_setup_type_by_slug_found(
-        self, temp_config_dir: Path, sample_setup_type_data: dict
-    ):
+    def test_get_setup_type_by_slug_found(self, shared_loader: ConfigLoader):
         """Test getting setup type by slug when it exists."""
-        import yaml
-
-        yaml_file = temp_config_dir / "fastapi.yaml"
-        with open(yaml_file, "w") as f:
-            yaml.dump(sample_setup_type_data, f)
-
-        loader = ConfigLoader(temp_config_dir)
-        setup_type = loader.get_setup_type_by_slug("fastapi")
+        setup_type = shared_loader.get_setup_type_by_slug("fastapi")
 
         assert setup_type is not None
         assert setup_type.slug == "fastapi"
@@ -1,8 +1,9 @@
 """Unit tests for DependencyInstaller."""
 
 import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +11,15 @@ from typysetup.core.dependency_installer import DependencyInstaller
 from typysetup.models import ProjectConfiguration, ProjectMetadata
 
 
+@dataclass(frozen=True)
+class FakeProc:
+    """Stand-in for the subprocess.CompletedProcess fields the installer reads."""
+
+    returncode: int = 0
+    stdout: str = ""
+    stderr: str = ""
+
+
 @pytest.fixture
 def temp_project_dir(tmp_path):
     """Create a temporary project directory."""
@@ -40,12 +50,20 @@ def project_metadata():
     )
 
 
+@pytest.fixture(autouse=True)
+def mock_subprocess():
+    """Patch subprocess.run so no test in this module spawns a real process."""
+    with patch("subprocess.run") as mock_run:
+        yield mock_run
+
+
 @pytest.fixture
 def installer():
     """Create a DependencyInstaller instance."""
     return DependencyInstaller()
 
 
+@pytest.mark.unit
 class TestDependencyInstallerInit:
     """Tests for DependencyInstaller initialization."""
 
@@ -57,217 +75,192 @@ class TestDependencyInstallerInit:
         assert installer.timeout_poetry == 900
 
 
+@pytest.mark.unit
 class TestExtractPackageName:
     """Tests for _extract_package_name method."""
 
-    def test_extract_simple_package(self, installer):
-        """Test extraction of simple package name."""
-        assert installer._extract_package_name("fastapi") == "fastapi"
-
-    def test_extract_with_version_specifier(self, installer):
-        """Test extraction with version specifier."""
-        assert installer._extract_package_name("fastapi>=0.104.0") == "fastapi"
-
-    def test_extract_with_extras(self, installer):
-        """Test extraction with package extras."""
-        assert installer._extract_package_name("uvicorn[standard]>=0.24.0") == "uvicorn"
-
-    def test_extract_with_multiple_extras(self, installer):
-        """Test extraction with multiple extras."""
-        assert installer._extract_package_name("requests[security,socks]>=2.28.0") == "requests"
-
-    def test_extract_with_complex_version(self, installer):
-        """Test extraction with complex version specifier."""
-        assert installer._extract_package_name("django>=3.2,<4.0") == "django"
-
-    def test_extract_with_multiple_operators(self, installer):
-        """Test extraction with multiple comparison operators."""
-        assert installer._extract_package_name("pytest>=7.0,!=7.1.0,<8.0") == "pytest"
+    @pytest.mark.parametrize(
+        "spec,expected",
+        [
+            ("fastapi", "fastapi"),
+            ("fastapi>=0.104.0", "fastapi"),
+            ("uvicorn[standard]>=0.24.0", "uvicorn"),
+            ("requests[security,socks]>=2.28.0", "requests"),
+            ("django>=3.2,<4.0", "django"),
+            ("pytest>=7.0,!=7.1.0,<8.0", "pytest"),
+        ],
+        ids=[
+            "simple",
+            "version_specifier",
+            "extras",
+            "multiple_extras",
+            "complex_version",
+            "multiple_operators",
+        ],
+    )
+    def test_extract(self, installer, spec, expected):
+        """Test extraction of the package name from a requirement spec."""
+        assert installer._extract_package_name(spec) == expected
 
 
+@pytest.mark.unit
 class TestParseInstalledPackages:
     """Tests for _parse_installed_packages method."""
 
-    def test_parse_pip_output_single_package(self, installer):
-        """Test parsing pip output with single package."""
-        output = "Successfully installed fastapi-0.104.1"
-        packages = installer._parse_installed_packages(output, "pip")
-        assert len(packages) == 1
-        assert packages[0] == ("fastapi", "0.104.1")
-
-    def test_parse_pip_output_multiple_packages(self, installer):
-        """Test parsing pip output with multiple packages."""
-        output = "Successfully installed fastapi-0.104.1 uvicorn-0.24.0 pydantic-2.5.0"
-        packages = installer._parse_installed_packages(output, "pip")
-        assert len(packages) == 3
-        assert ("fastapi", "0.104.1") in packages
-        assert ("uvicorn", "0.24.0") in packages
-        assert ("pydantic", "2.5.0") in packages
-
-    def test_parse_uv_output(self, installer):
-        """Test parsing uv output."""
-        output = "Installed 3 packages\nSuccessfully installed fastapi-0.104.1 uvicorn-0.24.0"
-        packages = installer._parse_installed_packages(output, "uv")
-        assert len(packages) >= 1
-        assert ("fastapi", "0.104.1") in packages or ("uvicorn", "0.24.0") in packages
-
-    def test_parse_poetry_output(self, installer):
-        """Test parsing poetry output."""
-        output = (
-            "Installing fastapi (0.104.1)\nInstalling uvicorn (0.24.0)\nInstalling pydantic (2.5.0)"
-        )
-        packages = installer._parse_installed_packages(output, "poetry")
-        assert len(packages) == 3
-        assert ("fastapi", "0.104.1") in packages
-        assert ("uvicorn", "0.24.0") in packages
-        assert ("pydantic", "2.5.0") in packages
-
-    def test_parse_empty_output(self, installer):
-        """Test parsing empty output."""
-        packages = installer._parse_installed_packages("", "pip")
-        assert packages == []
-
-    def test_parse_no_matches(self, installer):
-        """Test parsing output with no package matches."""
-        output = "This is some random output"
-        packages = installer._parse_installed_packages(output, "pip")
-        assert packages == []
+    @pytest.mark.parametrize(
+        "output,package_manager,expected",
+        [
+            ("Successfully installed fastapi-0.104.1", "pip", [("fastapi", "0.104.1")]),
+            (
+                "Successfully installed fastapi-0.104.1 uvicorn-0.24.0 pydantic-2.5.0",
+                "pip",
+                [("fastapi", "0.104.1"), ("uvicorn", "0.24.0"), ("pydantic", "2.5.0")],
+            ),
+            (
+                "Collecting fastapi>=0.104.0\n"
+                "  Downloading fastapi-0.104.1-py3-none-any.whl (92 kB)\n"
+                "Successfully installed fastapi-0.104.1 typing-extensions-4.8.0",
+                "pip",
+                [("fastapi", "0.104.1"), ("typing-extensions", "4.8.0")],
+            ),
+            (
+                "Installed 3 packages\nSuccessfully installed fastapi-0.104.1 uvicorn-0.24.0",
+                "uv",
+                [("fastapi", "0.104.1"), ("uvicorn", "0.24.0")],
+            ),
+            (
+                "Installing fastapi (0.104.1)\n"
+                "Installing uvicorn (0.24.0)\n"
+                "Installing pydantic (2.5.0)",
+                "poetry",
+                [("fastapi", "0.104.1"), ("uvicorn", "0.24.0"), ("pydantic", "2.5.0")],
+            ),
+            ("", "pip", []),
+            ("This is some random output", "pip", []),
+        ],
+        ids=[
+            "pip_single_package",
+            "pip_multiple_packages",
+            "pip_ignores_download_lines",
+            "uv",
+            "poetry",
+            "empty_output",
+            "no_matches",
+        ],
+    )
+    def test_parse(self, installer, output, package_manager, expected):
+        """Test parsing installed packages from package manager output."""
+        assert installer._parse_installed_packages(output, package_manager) == expected
 
 
+@pytest.mark.unit
 class TestGetInstalledVersion:
     """Tests for _get_installed_version method."""
 
-    @patch("subprocess.run")
-    def test_get_version_found(self, mock_run, installer):
+    def test_get_version_found(self, mock_subprocess, installer):
         """Test getting version when package is found."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Name: fastapi\nVersion: 0.104.1\nSummary: FastAPI"
-        mock_run.return_value = mock_result
+        mock_subprocess.return_value = FakeProc(
+            returncode=0, stdout="Name: fastapi\nVersion: 0.104.1\nSummary: FastAPI"
+        )
 
         version = installer._get_installed_version("fastapi", "/venv/bin/python")
         assert version == "0.104.1"
 
-    @patch("subprocess.run")
-    def test_get_version_not_found(self, mock_run, installer):
+    def test_get_version_not_found(self, mock_subprocess, installer):
         """Test getting version when package is not found."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_run.return_value = mock_result
+        mock_subprocess.return_value = FakeProc(returncode=1)
 
         version = installer._get_installed_version("nonexistent", "/venv/bin/python")
         assert version is None
 
-    @patch("subprocess.run")
-    def test_get_version_exception(self, mock_run, installer):
+    def test_get_version_exception(self, mock_subprocess, installer):
         """Test getting version when exception occurs."""
-        mock_run.side_effect = Exception("Test error")
+        mock_subprocess.side_effect = Exception("Test error")
 
         version = installer._get_installed_version("fastapi", "/venv/bin/python")
         assert version is None
 
 
+@pytest.mark.unit
 class TestInstallWithPip:
     """Tests for _install_with_pip method."""
 
-    @patch("subprocess.run")
-    def test_install_pip_success(self, mock_run, installer):
+    def test_install_pip_success(self, mock_subprocess, installer):
         """Test successful pip installation."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Successfully installed fastapi-0.104.1"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_subprocess.return_value = FakeProc(
+            returncode=0, stdout="Successfully installed fastapi-0.104.1"
+        )
 
         result = installer._install_with_pip(["fastapi>=0.104.0"], "/venv/bin/python")
 
         assert result.returncode == 0
-        mock_run.assert_called_once()
-        args, kwargs = mock_run.call_args
+        mock_subprocess.assert_called_once()
+        args, kwargs = mock_subprocess.call_args
         assert args[0][0] == "/venv/bin/python"
         assert "-m" in args[0]
         assert "pip" in args[0]
         assert "install" in args[0]
         assert kwargs["timeout"] == 600
 
-    @patch("subprocess.run")
-    def test_install_pip_failure(self, mock_run, installer):
+    def test_install_pip_failure(self, mock_subprocess, installer):
         """Test failed pip installation."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Package not found"
-        mock_run.return_value = mock_result
+        mock_subprocess.return_value = FakeProc(returncode=1, stderr="Package not found")
 
         result = installer._install_with_pip(["nonexistent"], "/venv/bin/python")
 
         assert result.returncode == 1
 
 
+@pytest.mark.unit
 class TestInstallWithUv:
     """Tests for _install_with_uv method."""
 
-    @patch("shutil.which")
-    @patch("subprocess.run")
-    def test_install_uv_success(self, mock_run, mock_which, installer):
+    def test_install_uv_success(self, mock_subprocess, installer):
         """Test successful uv installation."""
-        mock_which.return_value = "/usr/bin/uv"
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Installed 1 package"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_subprocess.return_value = FakeProc(returncode=0, stdout="Installed 1 package")
 
         result = installer._install_with_uv(["fastapi>=0.104.0"], "/venv/bin/python")
 
         assert result.returncode == 0
-        mock_run.assert_called_once()
-        args, kwargs = mock_run.call_args
+        mock_subprocess.assert_called_once()
+        args, kwargs = mock_subprocess.call_args
         assert args[0][0] == "uv"
         assert "pip" in args[0]
         assert "install" in args[0]
         assert "--python" in args[0]
         assert kwargs["timeout"] == 600
 
-    @patch("shutil.which")
-    def test_install_uv_not_found(self, mock_which, installer):
+    def test_install_uv_not_found(self, monkeypatch, installer):
         """Test uv installation when uv is not available."""
-        mock_which.return_value = None
+        monkeypatch.setattr("shutil.which", lambda name: None)
 
         with pytest.raises(FileNotFoundError):
             installer._install_with_uv(["fastapi>=0.104.0"], "/venv/bin/python")
 
 
+@pytest.mark.unit
 class TestInstallWithPoetry:
     """Tests for _install_with_poetry method."""
 
-    @patch("shutil.which")
-    @patch("subprocess.run")
-    def test_install_poetry_success(self, mock_run, mock_which, installer, temp_project_dir):
+    def test_install_poetry_success(self, mock_subprocess, installer, temp_project_dir):
         """Test successful poetry installation."""
-        mock_which.return_value = "/usr/bin/poetry"
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Installing fastapi (0.104.1)"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_subprocess.return_value = FakeProc(returncode=0, stdout="Installing fastapi (0.104.1)")
 
         result = installer._install_with_poetry(["fastapi>=0.104.0"], temp_project_dir)
 
         assert result.returncode == 0
         # Should be called twice: once for config, once for install
-        assert mock_run.call_count >= 1
+        assert mock_subprocess.call_count >= 1
 
-    @patch("shutil.which")
-    def test_install_poetry_not_found(self, mock_which, installer, temp_project_dir):
+    def test_install_poetry_not_found(self, monkeypatch, installer, temp_project_dir):
         """Test poetry installation when poetry is not available."""
-        mock_which.return_value = None
+        monkeypatch.setattr("shutil.which", lambda name: None)
 
         with pytest.raises(FileNotFoundError):
             installer._install_with_poetry(["fastapi>=0.104.0"], temp_project_dir)
 
 
+@pytest.mark.unit
 class TestInstallDependencies:
     """Tests for install_dependencies method."""
 
@@ -294,10 +287,9 @@ class TestInstallDependencies:
         self, mock_parse, mock_install, installer, project_config
     ):
         """Test successful installation with pip."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Successfully installed fastapi-0.104.1"
-        mock_install.return_value = mock_result
+        mock_install.return_value = FakeProc(
+            returncode=0, stdout="Successfully installed fastapi-0.104.1"
+        )
         mock_parse.return_value = [("fastapi", "0.104.1")]
 
         result = installer.install_dependencies(
@@ -314,11 +306,7 @@ class TestInstallDependencies:
     @patch.object(DependencyInstaller, "_install_with_pip")
     def test_install_dependencies_pip_failure(self, mock_install, installer, project_config):
         """Test failed installation with pip."""
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Package not found"
-        mock_install.return_value = mock_result
+        mock_install.return_value = FakeProc(returncode=1, stderr="Package not found")
 
         result = installer.install_dependencies(
             packages=["nonexistent"],
@@ -349,10 +337,7 @@ class TestInstallDependencies:
     @patch.object(DependencyInstaller, "_parse_installed_packages")
     def test_install_dependencies_uv(self, mock_parse, mock_install, installer, project_config):
         """Test installation with uv."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Installed 1 package"
-        mock_install.return_value = mock_result
+        mock_install.return_value = FakeProc(returncode=0, stdout="Installed 1 package")
         mock_parse.return_value = [("fastapi", "0.104.1")]
 
         result = installer.install_dependencies(
@@ -369,10 +354,7 @@ class TestInstallDependencies:
     @patch.object(DependencyInstaller, "_parse_installed_packages")
     def test_install_dependencies_poetry(self, mock_parse, mock_install, installer, project_config):
         """Test installation with poetry."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Installing fastapi (0.104.1)"
-        mock_install.return_value = mock_result
+        mock_install.return_value = FakeProc(returncode=0, stdout="Installing fastapi (0.104.1)")
         mock_parse.return_value = [("fastapi", "0.104.1")]
 
         result = installer.install_dependencies(
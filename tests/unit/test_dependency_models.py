@@ -1,5 +1,7 @@
 """Unit tests for dependency models: DependencyGroup, VersionConstraint, SetupTypeBuilder."""
 
+from typing import Callable, Optional
+
 import pytest
 
 from typysetup.models import (
@@ -10,6 +12,15 @@ from typysetup.models import (
 )
 
 
+@pytest.fixture(scope="class")
+def core_group() -> DependencyGroup:
+    """Provide a shared core DependencyGroup for read-only tests."""
+    return DependencyGroup(
+        group_name="core",
+        packages=["fastapi>=0.104.0", "uvicorn[standard]>=0.24.0", "pydantic"],
+    )
+
+
 class TestDependencyGroup:
     """Tests for DependencyGroup model."""
 
@@ -22,48 +33,40 @@ class TestDependencyGroup:
         assert group.group_name == "core"
         assert len(group.packages) == 2
 
-    def test_dependency_group_validation_invalid_name(self):
-        """Test that invalid group names are rejected."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"group_name": "Invalid Name", "packages": ["fastapi>=0.104.0"]},
+            {"group_name": "core", "packages": ["!!!invalid!!!"]},
+        ],
+        ids=["invalid_name", "invalid_package"],
+    )
+    def test_dependency_group_validation_rejects(self, kwargs):
+        """Test that invalid group names and package formats are rejected."""
         with pytest.raises(ValueError):
-            DependencyGroup(
-                group_name="Invalid Name",  # Has space
-                packages=["fastapi>=0.104.0"],
-            )
+            DependencyGroup(**kwargs)
 
-    def test_dependency_group_validation_invalid_package(self):
-        """Test that invalid package format is rejected."""
-        with pytest.raises(ValueError):
-            DependencyGroup(
-                group_name="core",
-                packages=["!!!invalid!!!"],
-            )
+    def test_bulk_construction(self):
+        """Test validating a large package list in one group."""
+        packages = [f"pkg{i}>=1.0" for i in range(1000)]
+        group = DependencyGroup(group_name="core", packages=packages)
+        assert group.get_package_count() == 1000
+        assert group.get_package_names()[-1] == "pkg999"
 
-    def test_get_package_names(self):
+    def test_get_package_names(self, core_group):
         """Test extracting package names without versions."""
-        group = DependencyGroup(
-            group_name="core",
-            packages=["fastapi>=0.104.0", "uvicorn[standard]>=0.24.0", "pydantic"],
-        )
-        names = group.get_package_names()
+        names = core_group.get_package_names()
         assert "fastapi" in names
         assert "uvicorn" in names
         assert "pydantic" in names
 
-    def test_get_package_count(self):
+    def test_get_package_count(self, core_group):
         """Test counting packages."""
-        group = DependencyGroup(
-            group_name="core",
-            packages=["fastapi>=0.104.0", "uvicorn[standard]>=0.24.0"],
-        )
-        assert group.get_package_count() == 2
+        assert core_group.get_package_count() == 3
 
-    def test_filter_by_version_spec(self):
+    def test_filter_by_version_spec(self, core_group):
         """Test filtering packages by version spec."""
-        group = DependencyGroup(
-            group_name="core",
-            packages=["fastapi>=0.104.0", "uvicorn>=0.24.0", "pydantic"],
-        )
-        versioned = group.filter_by_version_spec(">=")
+        versioned = core_group.filter_by_version_spec(">=")
         assert len(versioned) == 2
 
     def test_get_readable_description_provided(self):
@@ -82,15 +85,11 @@ class TestDependencyGroup:
             packages=["fastapi>=0.104.0"],
         )
         desc = group.get_readable_description()
-        assert "Core" in desc
+        assert desc == "Core dependencies required for basic functionality"
 
-    def test_to_installable_format(self):
+    def test_to_installable_format(self, core_group):
         """Test getting packages in pip-installable format."""
-        group = DependencyGroup(
-            group_name="core",
-            packages=["fastapi>=0.104.0", "uvicorn[standard]>=0.24.0"],
-        )
-        installable = group.to_installable_format()
+        installable = core_group.to_installable_format()
         assert "fastapi" in installable
         assert "uvicorn" in installable
 
@@ -98,56 +97,43 @@ class TestDependencyGroup:
 class TestVersionConstraint:
     """Tests for VersionConstraint model."""
 
-    def test_parse_minimum_version_plus(self):
-        """Test parsing 3.10+ format."""
-        constraint = VersionConstraint.from_string("3.10+")
-        assert constraint.constraint_type == ConstraintType.MINIMUM
-        assert constraint.min_version == "3.10"
-        assert constraint.is_satisfied_by("3.10")
-        assert constraint.is_satisfied_by("3.11")
-        assert not constraint.is_satisfied_by("3.9")
-
-    def test_parse_version_range(self):
-        """Test parsing 3.8-3.11 format."""
-        constraint = VersionConstraint.from_string("3.8-3.11")
-        assert constraint.constraint_type == ConstraintType.RANGE
-        assert constraint.min_version == "3.8"
-        assert constraint.max_version == "3.11"
-        assert constraint.is_satisfied_by("3.10")
-        assert not constraint.is_satisfied_by("3.7")
-        assert not constraint.is_satisfied_by("3.12")
-
-    def test_parse_greater_equal(self):
-        """Test parsing >=3.9 format."""
-        constraint = VersionConstraint.from_string(">=3.9")
-        assert constraint.constraint_type == ConstraintType.MINIMUM
-        assert constraint.is_satisfied_by("3.9")
-        assert constraint.is_satisfied_by("3.10")
-
-    def test_parse_less_equal(self):
-        """Test parsing <=3.11 format."""
-        constraint = VersionConstraint.from_string("<=3.11")
-        assert constraint.constraint_type == ConstraintType.MAXIMUM
-        assert constraint.is_satisfied_by("3.10")
-        assert not constraint.is_satisfied_by("3.12")
-
-    def test_parse_exact_with_equals(self):
-        """Test parsing ==3.10 format."""
-        constraint = VersionConstraint.from_string("==3.10")
-        assert constraint.constraint_type == ConstraintType.EXACT
-        assert constraint.is_satisfied_by("3.10")
-        assert not constraint.is_satisfied_by("3.11")
-
-    def test_parse_exact_plain(self):
-        """Test parsing plain 3.10 format."""
-        constraint = VersionConstraint.from_string("3.10")
-        assert constraint.constraint_type == ConstraintType.EXACT
-        assert constraint.is_satisfied_by("3.10")
-
-    def test_invalid_format_raises(self):
+    @pytest.mark.parametrize(
+        "constraint_str,constraint_type,min_version,max_version,satisfied,unsatisfied",
+        [
+            ("3.10+", ConstraintType.MINIMUM, "3.10", None, ["3.10", "3.11"], ["3.9"]),
+            ("3.8-3.11", ConstraintType.RANGE, "3.8", "3.11", ["3.10"], ["3.7", "3.12"]),
+            (">=3.9", ConstraintType.MINIMUM, "3.9", None, ["3.9", "3.10"], []),
+            ("<=3.11", ConstraintType.MAXIMUM, None, "3.11", ["3.10"], ["3.12"]),
+            ("==3.10", ConstraintType.EXACT, "3.10", None, ["3.10"], ["3.11"]),
+            ("3.10", ConstraintType.EXACT, "3.10", None, ["3.10"], []),
+        ],
+        ids=[
+            "minimum_version_plus",
+            "version_range",
+            "greater_equal",
+            "less_equal",
+            "exact_with_equals",
+            "exact_plain",
+        ],
+    )
+    def test_parse(
+        self, constraint_str, constraint_type, min_version, max_version, satisfied, unsatisfied
+    ):
+        """Test parsing each supported constraint format."""
+        constraint = VersionConstraint.from_string(constraint_str)
+        assert constraint.constraint_type == constraint_type
+        assert constraint.min_version == min_version
+        assert constraint.max_version == max_version
+        for version in satisfied:
+            assert constraint.is_satisfied_by(version)
+        for version in unsatisfied:
+            assert not constraint.is_satisfied_by(version)
+
+    @pytest.mark.parametrize("constraint_str", ["python3.10", "", "3.x", ">="])
+    def test_invalid_format_raises(self, constraint_str):
         """Test that invalid format raises ValueError."""
         with pytest.raises(ValueError):
-            VersionConstraint.from_string("python3.10")
+            VersionConstraint.from_string(constraint_str)
 
     def test_get_readable_format_minimum(self):
         """Test readable format for minimum constraint."""
@@ -174,111 +160,97 @@ class TestVersionConstraint:
             VersionConstraint.parse_version_string("invalid")
 
 
+@pytest.fixture(scope="session")
+def builder_template() -> dict:
+    """Provide the required builder fields shared by the SetupTypeBuilder tests."""
+    return {
+        "name": "FastAPI",
+        "slug": "fastapi",
+        "description": "Modern Web API Framework",
+        "python_version": "3.10+",
+        "supported_managers": ["uv"],
+        "core_dependency": "fastapi>=0.104.0",
+    }
+
+
+def _make_builder(template: dict, omit: Optional[str] = None) -> SetupTypeBuilder:
+    """Build a SetupTypeBuilder from the template, optionally leaving out one field."""
+    builder = SetupTypeBuilder()
+    if omit != "name":
+        builder.with_name(template["name"])
+    if omit != "slug":
+        builder.with_slug(template["slug"])
+    if omit != "description":
+        builder.with_description(template["description"])
+    if omit != "python_version":
+        builder.with_python_version(template["python_version"])
+    if omit != "supported_managers":
+        builder.with_supported_managers(list(template["supported_managers"]))
+    if omit != "core_dependency":
+        builder.add_dependency("core", template["core_dependency"])
+    return builder
+
+
+@pytest.fixture
+def base_builder(builder_template: dict) -> SetupTypeBuilder:
+    """Provide a builder with every required field already set."""
+    return _make_builder(builder_template)
+
+
+@pytest.fixture
+def partial_builder(builder_template: dict) -> Callable[[str], SetupTypeBuilder]:
+    """Provide a factory for builders missing exactly one required field."""
+    return lambda omit: _make_builder(builder_template, omit)
+
+
 class TestSetupTypeBuilder:
     """Tests for SetupTypeBuilder."""
 
-    def test_builder_basic_construction(self):
+    def test_builder_basic_construction(self, base_builder):
         """Test basic builder usage."""
-        setup = (
-            SetupTypeBuilder()
-            .with_name("FastAPI")
-            .with_slug("fastapi")
-            .with_description("Web API with FastAPI")
-            .with_python_version("3.10+")
-            .with_supported_managers(["uv", "pip"])
-            .add_dependency("core", "fastapi>=0.104.0")
-            .build()
-        )
+        setup = base_builder.build()
         assert setup.name == "FastAPI"
         assert setup.slug == "fastapi"
 
-    def test_builder_add_multiple_dependencies(self):
+    def test_builder_add_multiple_dependencies(self, base_builder):
         """Test adding dependencies in multiple groups."""
         setup = (
-            SetupTypeBuilder()
-            .with_name("FastAPI")
-            .with_slug("fastapi")
-            .with_description("Modern Web API Framework")
-            .with_python_version("3.10+")
-            .with_supported_managers(["uv"])
-            .add_dependency("core", "fastapi>=0.104.0")
-            .add_dependency("core", "uvicorn>=0.24.0")
+            base_builder.add_dependency("core", "uvicorn>=0.24.0")
             .add_dependency("dev", "pytest>=7.0")
             .build()
         )
         assert len(setup.dependencies["core"]) == 2
         assert len(setup.dependencies["dev"]) == 1
 
-    def test_builder_add_vscode_extensions(self):
+    def test_builder_add_vscode_extensions(self, base_builder):
         """Test adding VSCode extensions."""
         setup = (
-            SetupTypeBuilder()
-            .with_name("FastAPI")
-            .with_slug("fastapi")
-            .with_description("Modern Web API Framework")
-            .with_python_version("3.10+")
-            .with_supported_managers(["uv"])
-            .add_dependency("core", "fastapi>=0.104.0")
-            .add_vscode_extension("ms-python.python")
+            base_builder.add_vscode_extension("ms-python.python")
             .add_vscode_extension("ms-python.vscode-pylance")
             .build()
         )
         assert len(setup.vscode_extensions) == 2
 
-    def test_builder_add_tags(self):
+    def test_builder_add_tags(self, base_builder):
         """Test adding tags."""
-        setup = (
-            SetupTypeBuilder()
-            .with_name("FastAPI")
-            .with_slug("fastapi")
-            .with_description("Modern Web API Framework")
-            .with_python_version("3.10+")
-            .with_supported_managers(["uv"])
-            .add_dependency("core", "fastapi>=0.104.0")
-            .add_tags(["web", "api", "async"])
-            .build()
-        )
+        setup = base_builder.add_tags(["web", "api", "async"]).build()
         assert "web" in setup.tags
         assert "api" in setup.tags
 
-    def test_builder_missing_name(self):
+    def test_builder_missing_name(self, partial_builder):
         """Test that missing name raises error."""
         with pytest.raises(ValueError, match="Name is required"):
-            (
-                SetupTypeBuilder()
-                .with_slug("fastapi")
-                .with_description("Modern Web API Framework")
-                .with_python_version("3.10+")
-                .with_supported_managers(["uv"])
-                .add_dependency("core", "fastapi>=0.104.0")
-                .build()
-            )
-
-    def test_builder_missing_core_dependencies(self):
+            partial_builder("name").build()
+
+    def test_builder_missing_core_dependencies(self, partial_builder):
         """Test that missing core dependencies raises error."""
         with pytest.raises(ValueError, match="Core dependencies"):
-            (
-                SetupTypeBuilder()
-                .with_name("FastAPI")
-                .with_slug("fastapi")
-                .with_description("Modern Web API Framework")
-                .with_python_version("3.10+")
-                .with_supported_managers(["uv"])
-                .build()
-            )
-
-    def test_builder_missing_managers(self):
+            partial_builder("core_dependency").build()
+
+    def test_builder_missing_managers(self, partial_builder):
         """Test that missing managers raises error."""
         with pytest.raises(ValueError, match="Supported managers"):
-            (
-                SetupTypeBuilder()
-                .with_name("FastAPI")
-                .with_slug("fastapi")
-                .with_description("Modern Web API Framework")
-                .with_python_version("3.10+")
-                .add_dependency("core", "fastapi>=0.104.0")
-                .build()
-            )
+            partial_builder("supported_managers").build()
 
     def test_builder_reset(self):
         """Test resetting builder."""
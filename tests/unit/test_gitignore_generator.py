@@ -1,11 +1,28 @@
 """Unit tests for GitignoreGenerator."""
 
 from pathlib import Path
+from typing import Tuple
 
 import pytest
 
 from typysetup.core.gitignore_generator import GitignoreGenerator
 
+# Patterns every generated .gitignore must list, one per line
+EXPECTED_PATTERNS: Tuple[str, ...] = (
+    "venv/",
+    ".venv/",
+    "__pycache__/",
+    "dist/",
+    "build/",
+    "*.egg-info/",
+    ".pytest_cache/",
+    ".vscode/",
+    ".idea/",
+    ".DS_Store",
+    ".typysetup/",
+    "*.backup.*",
+)
+
 
 @pytest.fixture
 def temp_project_dir(tmp_path):
@@ -13,6 +30,18 @@ def temp_project_dir(tmp_path):
     return tmp_path
 
 
+@pytest.fixture(scope="module")
+def gitignore_dir(tmp_path_factory):
+    """Create a project directory shared by the read-only generation tests."""
+    return tmp_path_factory.mktemp("gitignore")
+
+
+@pytest.fixture(scope="module")
+def generated_gitignore(gitignore_dir):
+    """Generate a .gitignore once for the tests that only inspect it."""
+    return GitignoreGenerator.generate_gitignore(gitignore_dir)
+
+
 class TestGitignoreGeneratorInit:
     """Tests for GitignoreGenerator initialization."""
 
@@ -20,44 +49,29 @@ class TestGitignoreGeneratorInit:
         """Test that GitignoreGenerator has a template."""
         assert hasattr(GitignoreGenerator, "GITIGNORE_TEMPLATE")
         assert len(GitignoreGenerator.GITIGNORE_TEMPLATE) > 0
-        assert "venv/" in GitignoreGenerator.GITIGNORE_TEMPLATE
-        assert "__pycache__/" in GitignoreGenerator.GITIGNORE_TEMPLATE
-        assert "*.backup.*" in GitignoreGenerator.GITIGNORE_TEMPLATE
+
+        template_lines = {
+            line.strip() for line in GitignoreGenerator.GITIGNORE_TEMPLATE.splitlines()
+        }
+        for pattern in EXPECTED_PATTERNS:
+            assert pattern in template_lines, f"Pattern '{pattern}' not found in template"
 
 
 class TestGitignoreGeneration:
     """Tests for .gitignore generation."""
 
-    def test_generate_gitignore_creates_file(self, temp_project_dir):
+    def test_generate_gitignore_creates_file(self, gitignore_dir, generated_gitignore):
         """Test that generate_gitignore creates a .gitignore file."""
-        gitignore_path = GitignoreGenerator.generate_gitignore(temp_project_dir)
-
-        assert gitignore_path.exists()
-        assert gitignore_path.name == ".gitignore"
-        assert gitignore_path.parent == temp_project_dir
+        assert generated_gitignore.exists()
+        assert generated_gitignore.name == ".gitignore"
+        assert generated_gitignore.parent == gitignore_dir
 
-    def test_generate_gitignore_contains_expected_patterns(self, temp_project_dir):
+    def test_generate_gitignore_contains_expected_patterns(self, generated_gitignore):
         """Test that generated .gitignore contains expected patterns."""
-        gitignore_path = GitignoreGenerator.generate_gitignore(temp_project_dir)
-
-        content = gitignore_path.read_text()
-        expected_patterns = [
-            "venv/",
-            ".venv/",
-            "__pycache__/",
-            "dist/",
-            "build/",
-            "*.egg-info/",
-            ".pytest_cache/",
-            ".vscode/",
-            ".idea/",
-            ".DS_Store",
-            ".typysetup/",
-            "*.backup.*",
-        ]
-
-        for pattern in expected_patterns:
-            assert pattern in content, f"Pattern '{pattern}' not found in .gitignore"
+        content_lines = {line.strip() for line in generated_gitignore.read_text().splitlines()}
+
+        for pattern in EXPECTED_PATTERNS:
+            assert pattern in content_lines, f"Pattern '{pattern}' not found in .gitignore"
 
     def test_generate_gitignore_does_not_overwrite(self, temp_project_dir):
         """Test that generate_gitignore doesn't overwrite existing .gitignore."""
@@ -70,14 +84,11 @@ class TestGitignoreGeneration:
         returned_path = GitignoreGenerator.generate_gitignore(temp_project_dir)
 
         # Content should remain unchanged
-        assert returned_path.read_text() == custom_content
+        assert returned_path.read_bytes() == custom_content.encode("utf-8")
 
-    def test_generate_gitignore_returns_path(self, temp_project_dir):
+    def test_generate_gitignore_returns_path(self, gitignore_dir, generated_gitignore):
         """Test that generate_gitignore returns the correct path."""
-        expected_path = temp_project_dir / ".gitignore"
-        returned_path = GitignoreGenerator.generate_gitignore(temp_project_dir)
-
-        assert returned_path == expected_path
+        assert generated_gitignore == gitignore_dir / ".gitignore"
 
     def test_generate_gitignore_with_invalid_path_raises_error(self):
         """Test that generate_gitignore raises error with invalid path."""
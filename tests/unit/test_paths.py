@@ -8,6 +8,23 @@ import pytest
 from typysetup.utils import paths
 
 
+@pytest.fixture
+def mock_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point Path.home() and ~ expansion at a throwaway directory."""
+    home = tmp_path / "home"
+    monkeypatch.setattr(Path, "home", lambda: home)
+    # Path.expanduser reads the environment rather than calling Path.home
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    return home
+
+
+@pytest.fixture(scope="class")
+def fake_project_dir() -> Path:
+    """Provide a project path for pure path computations that never touch disk."""
+    return Path("/tmp/fake_project_typysetup_test")
+
+
 @pytest.mark.unit
 class TestPathUtilities:
     """Test path utility functions."""
@@ -16,68 +33,61 @@ class TestPathUtilities:
         """Test getting user config dir on Unix systems."""
         # This test checks the logic, not the actual system
         config_dir = paths.get_user_config_dir()
-        assert isinstance(config_dir, Path)
         assert config_dir.is_absolute()
 
-    def test_ensure_config_dir_exists(self, temp_project_dir: Path):
+    def test_ensure_config_dir_exists(self, mock_home: Path):
         """Test ensuring config directory exists."""
-        # Temporarily override home directory for testing
-        import unittest.mock
-
-        mock_home = temp_project_dir / "home"
-        with unittest.mock.patch("pathlib.Path.home", return_value=mock_home):
-            config_dir = paths.ensure_config_dir_exists()
-            assert config_dir.exists()
-            assert config_dir.is_dir()
+        config_dir = paths.ensure_config_dir_exists()
+        assert config_dir.exists()
+        assert config_dir.is_dir()
+        assert mock_home in config_dir.parents
 
-    def test_get_venv_path(self, temp_project_dir: Path):
+    def test_get_venv_path(self, fake_project_dir: Path):
         """Test getting venv path."""
-        venv_path = paths.get_venv_path(temp_project_dir)
-        assert venv_path == temp_project_dir / "venv"
+        venv_path = paths.get_venv_path(fake_project_dir)
+        assert venv_path == fake_project_dir / "venv"
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix-only venv layout")
     def test_get_venv_python_executable_unix(self):
         """Test getting venv Python executable on Unix."""
-        if sys.platform != "win32":
-            venv_path = Path("/tmp/venv")
-            python_exe = paths.get_venv_python_executable(venv_path)
-            assert python_exe.name == "python"
-            assert "bin" in str(python_exe)
+        venv_path = Path("/tmp/venv")
+        python_exe = paths.get_venv_python_executable(venv_path)
+        assert python_exe.name == "python"
+        assert "bin" in str(python_exe)
 
+    @pytest.mark.skipif(sys.platform != "win32", reason="Windows-only venv layout")
     def test_get_venv_python_executable_windows(self):
         """Test getting venv Python executable on Windows."""
-        if sys.platform == "win32":
-            venv_path = Path("C:\\project\\venv")
-            python_exe = paths.get_venv_python_executable(venv_path)
-            assert python_exe.name == "python.exe"
-            assert "Scripts" in str(python_exe)
+        venv_path = Path("C:\\project\\venv")
+        python_exe = paths.get_venv_python_executable(venv_path)
+        assert python_exe.name == "python.exe"
+        assert "Scripts" in str(python_exe)
 
     def test_get_venv_pip_executable(self):
         """Test getting venv pip executable."""
         venv_path = Path("/tmp/venv")
         pip_exe = paths.get_venv_pip_executable(venv_path)
-        assert isinstance(pip_exe, Path)
         assert "pip" in pip_exe.name.lower()
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix-only venv layout")
     def test_get_venv_activate_script_unix(self):
         """Test getting venv activation script on Unix."""
-        if sys.platform != "win32":
-            venv_path = Path("/tmp/venv")
-            activate = paths.get_venv_activate_script(venv_path)
-            assert activate.name == "activate"
-            assert "bin" in str(activate)
+        venv_path = Path("/tmp/venv")
+        activate = paths.get_venv_activate_script(venv_path)
+        assert activate.name == "activate"
+        assert "bin" in str(activate)
 
+    @pytest.mark.skipif(sys.platform != "win32", reason="Windows-only venv layout")
     def test_get_venv_activate_script_windows(self):
         """Test getting venv activation script on Windows."""
-        if sys.platform == "win32":
-            venv_path = Path("C:\\project\\venv")
-            activate = paths.get_venv_activate_script(venv_path)
-            assert activate.name == "activate.bat"
-            assert "Scripts" in str(activate)
+        venv_path = Path("C:\\project\\venv")
+        activate = paths.get_venv_activate_script(venv_path)
+        assert activate.name == "activate.bat"
+        assert "Scripts" in str(activate)
 
     def test_get_preferences_file_path(self):
         """Test getting preferences file path."""
         prefs_file = paths.get_preferences_file_path()
-        assert isinstance(prefs_file, Path)
         assert prefs_file.name == "preferences.json"
         assert ".typysetup" in str(prefs_file)
 
@@ -90,39 +100,35 @@ class TestPathUtilities:
         assert result.is_dir()
         assert result.is_absolute()
 
-    def test_ensure_project_directory_relative(self, temp_project_dir: Path):
+    def test_ensure_project_directory_relative(
+        self, temp_project_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test ensuring relative project directory is resolved."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(temp_project_dir)
-            result = paths.ensure_project_directory("./my_project")
-            assert result.is_absolute()
-            assert result.exists()
-        finally:
-            os.chdir(original_cwd)
-
-    def test_ensure_project_directory_with_tilde(self, temp_project_dir: Path):
+        monkeypatch.chdir(temp_project_dir)
+        result = paths.ensure_project_directory("./my_project")
+        assert result.is_absolute()
+        assert result.exists()
+
+    def test_ensure_project_directory_with_tilde(self, mock_home: Path):
         """Test that tilde in paths is expanded."""
-        # We can't actually test ~ expansion without mocking,
-        # but we can verify the function accepts it
-        assert paths.ensure_project_directory("~/test_project")
+        result = paths.ensure_project_directory("~/test_project")
+        assert result == (mock_home / "test_project").resolve()
+        assert result.exists()
 
-    def test_get_vscode_settings_path(self, temp_project_dir: Path):
+    def test_get_vscode_settings_path(self, fake_project_dir: Path):
         """Test getting VSCode settings.json path."""
-        settings_path = paths.get_vscode_settings_path(temp_project_dir)
-        assert settings_path == temp_project_dir / ".vscode" / "settings.json"
+        settings_path = paths.get_vscode_settings_path(fake_project_dir)
+        assert settings_path == fake_project_dir / ".vscode" / "settings.json"
 
-    def test_get_vscode_extensions_path(self, temp_project_dir: Path):
+    def test_get_vscode_extensions_path(self, fake_project_dir: Path):
         """Test getting VSCode extensions.json path."""
-        extensions_path = paths.get_vscode_extensions_path(temp_project_dir)
-        assert extensions_path == temp_project_dir / ".vscode" / "extensions.json"
+        extensions_path = paths.get_vscode_extensions_path(fake_project_dir)
+        assert extensions_path == fake_project_dir / ".vscode" / "extensions.json"
 
-    def test_get_vscode_launch_config_path(self, temp_project_dir: Path):
+    def test_get_vscode_launch_config_path(self, fake_project_dir: Path):
         """Test getting VSCode launch.json path."""
-        launch_path = paths.get_vscode_launch_config_path(temp_project_dir)
-        assert launch_path == temp_project_dir / ".vscode" / "launch.json"
+        launch_path = paths.get_vscode_launch_config_path(fake_project_dir)
+        assert launch_path == fake_project_dir / ".vscode" / "launch.json"
 
     def test_ensure_vscode_directory(self, temp_project_dir: Path):
         """Test ensuring .vscode directory exists."""
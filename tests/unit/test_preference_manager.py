@@ -1,6 +1,7 @@
 """Unit tests for PreferenceManager."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -49,6 +50,27 @@ class TestPreferenceManagerInit:
         manager = PreferenceManager(preferences_path=temp_prefs_file)
         assert manager.preferences_path == temp_prefs_file
 
+    def test_default_is_shared_per_path(self, tmp_path, monkeypatch):
+        """Test that default() reuses one manager per default preferences path."""
+        # Keep the managers cached here from leaking into later tests
+        monkeypatch.setattr(PreferenceManager, "_default_instances", {})
+        first_prefs = tmp_path / "first" / "preferences.json"
+        second_prefs = tmp_path / "second" / "preferences.json"
+
+        with patch(
+            "typysetup.core.preference_manager.get_preferences_file_path",
+            return_value=first_prefs,
+        ):
+            manager = PreferenceManager.default()
+            assert PreferenceManager.default() is manager
+            assert manager.preferences_path == first_prefs
+
+        with patch(
+            "typysetup.core.preference_manager.get_preferences_file_path",
+            return_value=second_prefs,
+        ):
+            assert PreferenceManager.default() is not manager
+
 
 class TestLoadPreferences:
     """Test loading preferences from disk."""
@@ -171,6 +193,34 @@ class TestLoadPreferences:
         with pytest.raises(PreferenceLoadError, match="Cannot create config directory"):
             pref_manager.load_preferences()
 
+    def test_load_unchanged_file_uses_cache(self, pref_manager, temp_prefs_file):
+        """Test that reloading an unchanged file returns the cached instance."""
+        prefs = pref_manager.load_preferences()
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError):
+            assert pref_manager.load_preferences() is prefs
+
+    def test_load_force_rereads_file(self, pref_manager, temp_prefs_file):
+        """Test that force=True re-reads the file even when the cache is current."""
+        prefs = pref_manager.load_preferences()
+
+        reloaded = pref_manager.load_preferences(force=True)
+
+        assert reloaded is not prefs
+        assert reloaded.preferred_manager == prefs.preferred_manager
+
+    def test_load_detects_same_size_replacement(self, pref_manager, temp_prefs_file):
+        """Test that a replaced file with the same size and mtime is still re-read."""
+        pref_manager.save_preferences(UserPreference(preferred_manager="pip"))
+        stat = temp_prefs_file.stat()
+
+        replacement = temp_prefs_file.with_name("replacement.json")
+        replacement.write_bytes(temp_prefs_file.read_bytes().replace(b'"pip"', b'"uv" '))
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, temp_prefs_file)
+
+        assert pref_manager.load_preferences().preferred_manager == "uv"
+
 
 class TestSavePreferences:
     """Test saving preferences to disk."""
@@ -214,23 +264,83 @@ class TestSavePreferences:
             backup_data = json.load(f)
         assert backup_data["preferred_manager"] == "pip"
 
+    def test_save_backup_falls_back_to_copy(self, pref_manager, temp_prefs_file):
+        """Test that the backup is copied when hardlinking is not possible."""
+        pref_manager.save_preferences(UserPreference(preferred_manager="pip"))
+
+        with patch("os.link", side_effect=OSError("cross-device link")):
+            pref_manager.save_preferences(UserPreference(preferred_manager="poetry"))
+
+        with open(temp_prefs_file.with_suffix(".json.backup")) as f:
+            assert json.load(f)["preferred_manager"] == "pip"
+
+    def test_save_keeps_backup_when_backup_fails(self, pref_manager, temp_prefs_file):
+        """Test that the previous backup survives when neither link nor copy succeeds."""
+        pref_manager.save_preferences(UserPreference(preferred_manager="pip"))
+        pref_manager.save_preferences(UserPreference(preferred_manager="poetry"))
+        backup_file = temp_prefs_file.with_suffix(".json.backup")
+
+        with patch("os.link", side_effect=OSError("link failed")), patch(
+            "shutil.copy2", side_effect=OSError("copy failed")
+        ):
+            pref_manager.save_preferences(UserPreference(preferred_manager="uv"))
+
+        with open(backup_file) as f:
+            assert json.load(f)["preferred_manager"] == "pip"
+        assert not temp_prefs_file.with_suffix(".json.backup.tmp").exists()
+
+    def test_save_follows_reassigned_path(self, pref_manager, temp_prefs_file, tmp_path):
+        """Test that backup and temp files follow a reassigned preferences_path."""
+        pref_manager.save_preferences(UserPreference(preferred_manager="pip"))
+
+        moved_prefs = tmp_path / "moved" / "preferences.json"
+        moved_prefs.parent.mkdir()
+        moved_prefs.write_bytes(temp_prefs_file.read_bytes())
+        pref_manager.preferences_path = moved_prefs
+        pref_manager.save_preferences(UserPreference(preferred_manager="poetry"))
+
+        assert moved_prefs.with_suffix(".json.backup").exists()
+        assert not temp_prefs_file.with_suffix(".json.backup").exists()
+        assert not temp_prefs_file.with_suffix(".json.tmp").exists()
+
+    def test_save_skips_unchanged_preferences(self, pref_manager, temp_prefs_file):
+        """Test that saving identical preferences leaves the file and backup untouched."""
+        pref_manager.save_preferences(UserPreference(preferred_manager="pip"))
+        saved_bytes = temp_prefs_file.read_bytes()
+
+        pref_manager.save_preferences(UserPreference(preferred_manager="pip"))
+
+        assert temp_prefs_file.read_bytes() == saved_bytes
+        assert not temp_prefs_file.with_suffix(".json.backup").exists()
+
+    def test_save_rewrites_after_external_change(self, pref_manager, temp_prefs_file):
+        """Test that an unchanged save still writes if the file changed on disk."""
+        pref_manager.save_preferences(UserPreference(preferred_manager="pip"))
+        temp_prefs_file.write_text("{}")
+
+        pref_manager.save_preferences(UserPreference(preferred_manager="pip"))
+
+        with open(temp_prefs_file) as f:
+            data = json.load(f)
+        assert data["preferred_manager"] == "pip"
+
     def test_save_is_atomic(self, pref_manager, temp_prefs_file):
         """Test that save uses atomic write (temp file then rename)."""
         prefs = UserPreference(preferred_manager="uv")
 
         # Mock the file operations to verify atomic write
-        original_open = open
+        original_open = os.open
 
         temp_file_created = False
         temp_file_path = temp_prefs_file.with_suffix(".json.tmp")
 
-        def mock_open(path, *args, **kwargs):
+        def mock_open(path, flags, *args, **kwargs):
             nonlocal temp_file_created
-            if Path(path) == temp_file_path and "w" in args[0]:
+            if Path(path) == temp_file_path and flags & os.O_WRONLY:
                 temp_file_created = True
-            return original_open(path, *args, **kwargs)
+            return original_open(path, flags, *args, **kwargs)
 
-        with patch("builtins.open", side_effect=mock_open):
+        with patch("os.open", side_effect=mock_open):
             pref_manager.save_preferences(prefs)
 
         assert temp_file_created
@@ -290,6 +400,11 @@ class TestUpdatePreference:
         with pytest.raises(ValueError, match="Invalid preference key"):
             pref_manager.update_preference("invalid_key", "value")
 
+    def test_update_method_name_rejected(self, pref_manager):
+        """Test that model attributes which are not fields are rejected as keys."""
+        with pytest.raises(ValueError, match="Invalid preference key"):
+            pref_manager.update_preference("model_dump", "value")
+
     def test_update_invalid_value_raises_error(self, pref_manager):
         """Test that invalid value is handled appropriately."""
         pref_manager.load_preferences()
@@ -351,6 +466,92 @@ class TestAddSetupHistory:
         # Should keep the most recent ones
         assert prefs.setup_history[-1].project_name == "Project 24"
 
+    def test_batched_history_writes_once(self, pref_manager, temp_prefs_file):
+        """Test that history added inside a with block is written once on exit."""
+        pref_manager.load_preferences()
+
+        with patch.object(
+            pref_manager, "save_preferences", wraps=pref_manager.save_preferences
+        ) as mock_save:
+            with pref_manager:
+                for i in range(25):
+                    pref_manager.add_setup_history(
+                        setup_type_slug="test-type",
+                        project_path=f"/project{i}",
+                        project_name=f"Project {i}",
+                        python_version="3.11",
+                        package_manager="uv",
+                        success=True,
+                    )
+                mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+
+        reloaded = pref_manager.load_preferences()
+        assert len(reloaded.setup_history) == 20
+        assert reloaded.setup_history[-1].project_name == "Project 24"
+
+    def test_nested_batches_write_once_on_outer_exit(self, pref_manager):
+        """Test that an inner with block does not end the outer batch."""
+        pref_manager.load_preferences()
+
+        with patch.object(
+            pref_manager, "save_preferences", wraps=pref_manager.save_preferences
+        ) as mock_save:
+            with pref_manager:
+                with pref_manager:
+                    pref_manager.update_preference("preferred_manager", "pip")
+                pref_manager.update_preference("preferred_python_version", "3.12")
+                mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+        reloaded = pref_manager.load_preferences(force=True)
+        assert reloaded.preferred_manager == "pip"
+        assert reloaded.preferred_python_version == "3.12"
+
+    def test_batch_discarded_when_block_raises(self, pref_manager):
+        """Test that a with block that raises leaves the file untouched."""
+        pref_manager.load_preferences()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            with pref_manager:
+                pref_manager.update_preference("preferred_manager", "pip")
+                raise RuntimeError("boom")
+
+        assert pref_manager.get_preferences().preferred_manager == "uv"
+
+    def test_history_limit_survives_reload(self, pref_manager, temp_prefs_file):
+        """Test that history loaded from disk stays capped on further appends."""
+        pref_manager.load_preferences()
+
+        for i in range(21):
+            pref_manager.add_setup_history(
+                setup_type_slug="test-type",
+                project_path=f"/project{i}",
+                project_name=f"Project {i}",
+                python_version="3.11",
+                package_manager="uv",
+                success=True,
+            )
+
+        reloaded = PreferenceManager(preferences_path=temp_prefs_file)
+        prefs = reloaded.load_preferences()
+        assert len(prefs.setup_history) == 20
+
+        reloaded.add_setup_history(
+            setup_type_slug="test-type",
+            project_path="/project21",
+            project_name="Project 21",
+            python_version="3.11",
+            package_manager="uv",
+            success=True,
+        )
+
+        prefs = reloaded.get_preferences()
+        assert len(prefs.setup_history) == 20
+        assert prefs.setup_history[0].project_name == "Project 2"
+        assert prefs.setup_history[-1].project_name == "Project 21"
+
 
 class TestUpdateAfterSetup:
     """Test updating preferences after a setup operation."""
@@ -446,6 +647,27 @@ class TestUpdateAfterSetup:
         assert prefs.preferred_setup_types[0] == "fastapi-api"
         assert prefs.preferred_setup_types[1] == "basic-script"
 
+    def test_preferred_setup_types_promote_and_limit(self):
+        """Test that re-used types move to the front and the list is capped at 10."""
+        prefs = UserPreference()
+        for i in range(12):
+            prefs.add_preferred_setup_type(f"type-{i}")
+
+        prefs.add_preferred_setup_type("type-5")
+
+        assert prefs.preferred_setup_types == [
+            "type-5",
+            "type-11",
+            "type-10",
+            "type-9",
+            "type-8",
+            "type-7",
+            "type-6",
+            "type-4",
+            "type-3",
+            "type-2",
+        ]
+
 
 class TestResetToDefaults:
     """Test resetting preferences to defaults."""
@@ -468,6 +690,15 @@ class TestResetToDefaults:
             backup_data = json.load(f)
         assert backup_data["preferred_manager"] == "poetry"
 
+    def test_reset_of_defaults_detaches_backup(self, pref_manager, temp_prefs_file):
+        """Test that resetting unchanged defaults still leaves the backup on its own inode."""
+        pref_manager.load_preferences()
+
+        pref_manager.reset_to_defaults()
+
+        backup_file = next(temp_prefs_file.parent.glob("preferences.json.backup_*"))
+        assert not os.path.samefile(backup_file, temp_prefs_file)
+
     def test_reset_restores_defaults(self, pref_manager):
         """Test that reset restores all default values."""
         # Create custom preferences
@@ -506,6 +737,17 @@ class TestGetPreferences:
 
         assert prefs1 is prefs2
 
+    def test_get_preferences_cached_skips_disk(self, pref_manager, temp_prefs_file):
+        """Test that cached preferences are returned without touching the file."""
+        prefs = pref_manager.load_preferences()
+        temp_prefs_file.unlink()
+
+        with patch.object(pref_manager, "load_preferences", side_effect=AssertionError):
+            assert pref_manager.get_preferences() is prefs
+            assert pref_manager.preferences is prefs
+
+        assert not temp_prefs_file.exists()
+
     def test_preferences_property(self, pref_manager):
         """Test the preferences property accessor."""
         prefs = pref_manager.preferences
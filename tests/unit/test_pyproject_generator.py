@@ -1,24 +1,46 @@
 """Unit tests for PyProjectGenerator."""
 
+import os
 import sys
+from contextlib import nullcontext
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import List
+from unittest.mock import patch
 
 import pytest
-import tomli_w
 
 from typysetup.core.pyproject_generator import PyprojectGenerator
 from typysetup.models import ProjectMetadata
 
-# Use tomllib for Python 3.11+, tomli for earlier versions
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli as tomllib
-    except ImportError:
+# Prefer tomli when installed (its wheels are mypyc-compiled), else stdlib tomllib on 3.11+
+try:
+    import tomli as tomllib
+except ImportError:
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
         tomllib = None
 
+# Pre-encoded pyproject.toml standing in for a project's existing file
+EXISTING_PYPROJECT_BYTES = b'[project]\nname = "old_project"\n'
+
+
+# Tests that parse generated TOML need tomllib (3.11+) or tomli
+requires_toml = pytest.mark.skipif(tomllib is None, reason="tomli not available")
+
+
+def _read_toml(path: Path) -> dict:
+    """Parse a TOML file."""
+    return tomllib.loads(path.read_text(encoding="utf-8"))
+
+
+def _list_backups(directory: Path) -> List[Path]:
+    """Return pyproject.toml backups in a directory with one scandir and a prefix check."""
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path) for entry in entries if entry.name.startswith("pyproject.toml.backup")
+        ]
+
 
 @pytest.fixture
 def temp_project_dir(tmp_path):
@@ -26,9 +48,9 @@ def temp_project_dir(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_metadata():
-    """Create sample ProjectMetadata."""
+    """Create sample ProjectMetadata (shared; tests must not mutate it)."""
     return ProjectMetadata(
         project_name="test_project",
         project_description="A test project",
@@ -37,31 +59,43 @@ def project_metadata():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generator():
-    """Create a PyprojectGenerator instance."""
+    """Create a PyprojectGenerator instance (stateless, so shared across tests)."""
     return PyprojectGenerator()
 
 
+@pytest.fixture
+def mock_backup_manager():
+    """Patch FileBackupManager in the generator module and return the mocked instance."""
+    with patch("typysetup.core.pyproject_generator.FileBackupManager") as mock_manager_class:
+        yield mock_manager_class.return_value
+
+
+@pytest.fixture(scope="class")
+def minimal_config(generator, project_metadata):
+    """Build the config for the sample metadata with no dependencies, once per class."""
+    return generator._build_config(
+        project_metadata,
+        dependencies=[],
+        python_version="3.10+",
+    )
+
+
 class TestPyprojectGeneratorInit:
     """Tests for PyprojectGenerator initialization."""
 
-    def test_init_creates_backup_manager(self):
+    def test_init_creates_backup_manager(self, generator):
         """Test that __init__ creates FileBackupManager."""
-        generator = PyprojectGenerator()
         assert generator.file_backup_manager is not None
 
 
 class TestBuildConfig:
     """Tests for _build_config method."""
 
-    def test_build_config_minimal(self, generator, project_metadata):
+    def test_build_config_minimal(self, minimal_config):
         """Test building config with minimal metadata."""
-        config = generator._build_config(
-            project_metadata,
-            dependencies=[],
-            python_version="3.10+",
-        )
+        config = minimal_config
 
         assert "project" in config
         assert config["project"]["name"] == "test_project"
@@ -123,22 +157,17 @@ class TestBuildConfig:
 
         assert config["project"]["requires-python"] == ">=3.9"
 
-    def test_build_config_includes_readme(self, generator, project_metadata):
+    def test_build_config_includes_readme(self, minimal_config):
         """Test that README.md is included in config."""
-        config = generator._build_config(
-            project_metadata,
-            dependencies=[],
-            python_version="3.10+",
-        )
-
-        assert config["project"]["readme"] == "README.md"
+        assert minimal_config["project"]["readme"] == "README.md"
 
 
 class TestGeneratePyprojectToml:
     """Tests for generate_pyproject_toml method."""
 
+    @requires_toml
     def test_generate_new_pyproject(self, generator, project_metadata, temp_project_dir):
-        """Test generating a new pyproject.toml."""
+        """Test generating a new, valid PEP 621 pyproject.toml."""
         pyproject_path = temp_project_dir / "pyproject.toml"
 
         result = generator.generate_pyproject_toml(
@@ -151,15 +180,19 @@ class TestGeneratePyprojectToml:
         assert result == pyproject_path
         assert pyproject_path.exists()
 
-        # Verify the content
-        if tomllib is None:
-            pytest.skip("tomli not available")
-        with open(pyproject_path, "rb") as f:
-            config = tomllib.load(f)
+        # Verify the content (parses as TOML)
+        config = _read_toml(pyproject_path)
 
-        assert config["project"]["name"] == "test_project"
-        assert config["project"]["version"] == "0.1.0"
-        assert "fastapi>=0.104.0" in config["project"]["dependencies"]
+        # PEP 621 requires a [project] table with name and version strings
+        assert isinstance(config["project"], dict)
+        project_section = config["project"]
+        assert isinstance(project_section["name"], str)
+        assert isinstance(project_section["version"], str)
+        assert "requires-python" in project_section
+
+        assert project_section["name"] == "test_project"
+        assert project_section["version"] == "0.1.0"
+        assert "fastapi>=0.104.0" in project_section["dependencies"]
 
     def test_generate_pyproject_with_existing_file(
         self, generator, project_metadata, temp_project_dir
@@ -168,9 +201,7 @@ class TestGeneratePyprojectToml:
         pyproject_path = temp_project_dir / "pyproject.toml"
 
         # Create existing file
-        existing_config = {"project": {"name": "old_project"}}
-        with open(pyproject_path, "wb") as f:
-            tomli_w.dump(existing_config, f)
+        pyproject_path.write_bytes(EXISTING_PYPROJECT_BYTES)
 
         # Generate new config
         result = generator.generate_pyproject_toml(
@@ -184,9 +215,10 @@ class TestGeneratePyprojectToml:
         assert pyproject_path.exists()
 
         # Verify backup was created
-        backup_files = list(temp_project_dir.glob("pyproject.toml.backup*"))
+        backup_files = _list_backups(temp_project_dir)
         assert len(backup_files) == 1
 
+    @requires_toml
     def test_generate_pyproject_backup_created_for_existing_file(
         self, generator, project_metadata, temp_project_dir
     ):
@@ -206,16 +238,14 @@ class TestGeneratePyprojectToml:
         assert result.exists()
 
         # Verify backup was created
-        backup_files = list(temp_project_dir.glob("pyproject.toml.backup*"))
+        backup_files = _list_backups(temp_project_dir)
         assert len(backup_files) == 1, "Expected exactly one backup file"
 
         # Verify backup contains old content
-        if tomllib is None:
-            pytest.skip("tomli not available")
-        with open(backup_files[0], "rb") as f:
-            backup_config = tomllib.load(f)
+        backup_config = _read_toml(backup_files[0])
         assert backup_config["project"]["name"] == "old_project"
 
+    @requires_toml
     def test_generate_pyproject_with_multiple_dependencies(
         self, generator, project_metadata, temp_project_dir
     ):
@@ -236,129 +266,47 @@ class TestGeneratePyprojectToml:
 
         assert result.exists()
 
-        # Verify all dependencies are included
-        if tomllib is None:
-            pytest.skip("tomli not available")
-        with open(result, "rb") as f:
-            config = tomllib.load(f)
+        # Verify all dependencies are included, in the order given
+        config = _read_toml(result)
 
-        assert len(config["project"]["dependencies"]) == 4
-        for dep in dependencies:
-            assert dep in config["project"]["dependencies"]
+        assert config["project"]["dependencies"] == dependencies
 
+    @requires_toml
+    @pytest.mark.parametrize("py_version", ["3.8+", "3.9+", "3.10+", "3.11+", "3.12+"])
     def test_generate_pyproject_different_python_versions(
-        self, generator, project_metadata, temp_project_dir
+        self, generator, project_metadata, temp_project_dir, py_version
     ):
         """Test generating pyproject.toml with different Python versions."""
-        for py_version in ["3.8+", "3.9+", "3.10+", "3.11+", "3.12+"]:
-            subdir = temp_project_dir / py_version.replace(".", "_").replace("+", "")
-            subdir.mkdir(exist_ok=True)
-
-            result = generator.generate_pyproject_toml(
-                project_path=subdir,
-                metadata=project_metadata,
-                dependencies=[],
-                python_version=py_version,
-            )
-
-            assert result.exists()
-
-            # Verify version is correct
-            if tomllib is None:
-                pytest.skip("tomli not available")
-            with open(result, "rb") as f:
-                config = tomllib.load(f)
-
-            expected_version = py_version.rstrip("+")
-            assert config["project"]["requires-python"] == f">={expected_version}"
-
-
-class TestRestoreBackup:
-    """Tests for restore_backup method."""
-
-    @patch("typysetup.core.pyproject_generator.FileBackupManager")
-    def test_restore_backup_success(self, mock_manager_class):
-        """Test successful backup restoration."""
-        mock_manager = MagicMock()
-        mock_manager_class.return_value = mock_manager
-
-        generator = PyprojectGenerator()
-        generator.restore_backup(Path("/tmp/pyproject.toml"), Path("/tmp/backup"))
-
-        mock_manager.restore_backup.assert_called_once()
-
-    @patch("typysetup.core.pyproject_generator.FileBackupManager")
-    def test_restore_backup_error(self, mock_manager_class):
-        """Test backup restoration with error."""
-        mock_manager = MagicMock()
-        mock_manager.restore_backup.side_effect = Exception("Restore failed")
-        mock_manager_class.return_value = mock_manager
-
-        generator = PyprojectGenerator()
-        with pytest.raises(IOError):
-            generator.restore_backup(Path("/tmp/pyproject.toml"), Path("/tmp/backup"))
-
-
-class TestGeneratePyprojectValidation:
-    """Tests for validation in generate_pyproject_toml."""
-
-    def test_generated_file_is_valid_toml(self, generator, project_metadata, temp_project_dir):
-        """Test that generated file is valid TOML."""
         result = generator.generate_pyproject_toml(
             project_path=temp_project_dir,
             metadata=project_metadata,
-            dependencies=["fastapi>=0.104.0"],
-            python_version="3.10+",
+            dependencies=[],
+            python_version=py_version,
         )
 
-        # Should be readable as TOML without errors
-        if tomllib is None:
-            pytest.skip("tomli not available")
-        with open(result, "rb") as f:
-            config = tomllib.load(f)
+        assert result.exists()
 
-        assert isinstance(config, dict)
-        assert "project" in config
+        # Verify version is correct
+        config = _read_toml(result)
 
-    def test_generated_file_has_required_fields(
-        self, generator, project_metadata, temp_project_dir
-    ):
-        """Test that generated file has all required fields."""
-        result = generator.generate_pyproject_toml(
-            project_path=temp_project_dir,
-            metadata=project_metadata,
-            dependencies=[],
-            python_version="3.10+",
-        )
-
-        if tomllib is None:
-            pytest.skip("tomli not available")
-        with open(result, "rb") as f:
-            config = tomllib.load(f)
+        expected_version = py_version.rstrip("+")
+        assert config["project"]["requires-python"] == f">={expected_version}"
 
-        project_section = config["project"]
-        assert "name" in project_section
-        assert "version" in project_section
-        assert "requires-python" in project_section
 
-    def test_generated_file_pep_621_compliant(self, generator, project_metadata, temp_project_dir):
-        """Test that generated file is PEP 621 compliant."""
-        result = generator.generate_pyproject_toml(
-            project_path=temp_project_dir,
-            metadata=project_metadata,
-            dependencies=["fastapi>=0.104.0"],
-            python_version="3.10+",
-        )
+class TestRestoreBackup:
+    """Tests for restore_backup method."""
 
-        if tomllib is None:
-            pytest.skip("tomli not available")
-        with open(result, "rb") as f:
-            config = tomllib.load(f)
+    @pytest.mark.parametrize(
+        "side_effect, expectation",
+        [(None, nullcontext()), (Exception("Restore failed"), pytest.raises(IOError))],
+        ids=["success", "error"],
+    )
+    def test_restore_backup(self, mock_backup_manager, side_effect, expectation):
+        """Test backup restoration succeeds, or raises IOError when the manager fails."""
+        mock_backup_manager.restore_backup.side_effect = side_effect
 
-        # PEP 621 requires these fields
-        assert "project" in config
-        assert isinstance(config["project"], dict)
+        generator = PyprojectGenerator()
+        with expectation:
+            generator.restore_backup(Path("/tmp/pyproject.toml"), Path("/tmp/backup"))
 
-        # Check that version is a string, not a list
-        assert isinstance(config["project"]["version"], str)
-        assert isinstance(config["project"]["name"], str)
+        mock_backup_manager.restore_backup.assert_called_once()
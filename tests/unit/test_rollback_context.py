@@ -92,24 +92,21 @@ class TestRollbackContext:
         assert cleanup2_called
         assert cleanup3_called
 
-    def test_rollback_with_multiple_cleanup_actions(self):
+    @pytest.mark.parametrize("count", [10, 1000], ids=["few", "many"])
+    def test_rollback_with_multiple_cleanup_actions(self, count):
         """Test rollback with many cleanup actions."""
-        cleanup_count = 0
+        calls = [0]
 
-        def make_cleanup(num):
-            def cleanup():
-                nonlocal cleanup_count
-                cleanup_count += 1
-
-            return cleanup
+        def cleanup():
+            calls[0] += 1
 
         with pytest.raises(RuntimeError):
             with RollbackContext() as ctx:
-                for i in range(10):
-                    ctx.register_cleanup(make_cleanup(i), f"Cleanup {i}")
+                for i in range(count):
+                    ctx.register_cleanup(cleanup, f"Cleanup {i}")
                 raise RuntimeError("Test error")
 
-        assert cleanup_count == 10
+        assert calls[0] == count
 
     def test_rollback_context_exception_propagates(self):
         """Test that original exception is propagated after cleanup."""
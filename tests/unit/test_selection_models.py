@@ -1,30 +1,52 @@
 """Unit tests for selection models: DependencySelection and ProjectMetadata."""
 
+from typing import Tuple
+
 import pytest
+from pydantic import ValidationError
 
 from typysetup.models import DependencySelection, ProjectMetadata, SetupTypeBuilder
 
+# Author emails accepted and rejected by ProjectMetadata's email validator
+VALID_EMAILS: Tuple[str, ...] = (
+    "user@example.com",
+    "john.doe@example.co.uk",
+    "test+tag@example.org",
+)
+INVALID_EMAILS: Tuple[str, ...] = ("not-an-email", "@example.com", "user@", "user@.com")
+
+
+@pytest.fixture(scope="module")
+def sample_setup_type():
+    """Create a sample setup type for testing (built once; tests only read it)."""
+    return (
+        SetupTypeBuilder()
+        .with_name("FastAPI")
+        .with_slug("fastapi")
+        .with_description("Web API with FastAPI")
+        .with_python_version("3.10+")
+        .with_supported_managers(["uv", "pip"])
+        .add_dependency("core", "fastapi>=0.104.0")
+        .add_dependency("core", "uvicorn[standard]>=0.24.0")
+        .add_dependency("dev", "pytest>=7.0")
+        .add_dependency("optional", "httpx>=0.24.0")
+        .build()
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_selection():
+    """Create a DependencySelection with two of three groups selected (read-only)."""
+    return DependencySelection(
+        setup_type_slug="fastapi",
+        selected_groups={"core": True, "dev": True, "optional": False},
+        all_packages=["pkg1", "pkg2", "pkg3"],
+    )
+
 
 class TestDependencySelection:
     """Tests for DependencySelection model."""
 
-    @pytest.fixture
-    def sample_setup_type(self):
-        """Create a sample setup type for testing."""
-        return (
-            SetupTypeBuilder()
-            .with_name("FastAPI")
-            .with_slug("fastapi")
-            .with_description("Web API with FastAPI")
-            .with_python_version("3.10+")
-            .with_supported_managers(["uv", "pip"])
-            .add_dependency("core", "fastapi>=0.104.0")
-            .add_dependency("core", "uvicorn[standard]>=0.24.0")
-            .add_dependency("dev", "pytest>=7.0")
-            .add_dependency("optional", "httpx>=0.24.0")
-            .build()
-        )
-
     def test_dependency_selection_creation(self, sample_setup_type):
         """Test creating a DependencySelection."""
         selection = DependencySelection(
@@ -37,8 +59,6 @@ class TestDependencySelection:
 
     def test_core_must_be_selected(self):
         """Test that core group must be selected."""
-        from pydantic_core import ValidationError
-
         with pytest.raises((ValueError, ValidationError)):
             DependencySelection(
                 setup_type_slug="fastapi",
@@ -55,35 +75,18 @@ class TestDependencySelection:
                 all_packages=[],
             )
 
-    def test_get_selected_groups(self):
-        """Test getting list of selected group names."""
-        selection = DependencySelection(
-            setup_type_slug="fastapi",
-            selected_groups={"core": True, "dev": True, "optional": False},
-            all_packages=["pkg1", "pkg2"],
-        )
-        selected = selection.get_selected_groups()
-        assert "core" in selected
-        assert "dev" in selected
-        assert "optional" not in selected
-
-    def test_get_total_package_count(self):
-        """Test getting total package count."""
-        selection = DependencySelection(
-            setup_type_slug="fastapi",
-            selected_groups={"core": True, "dev": True},
-            all_packages=["pkg1", "pkg2", "pkg3"],
-        )
-        assert selection.get_total_package_count() == 3
-
-    def test_get_group_count(self):
-        """Test getting count of selected groups."""
-        selection = DependencySelection(
-            setup_type_slug="fastapi",
-            selected_groups={"core": True, "dev": True, "optional": False},
-            all_packages=["pkg1"],
-        )
-        assert selection.get_group_count() == 2
+    @pytest.mark.parametrize(
+        "getter, expected",
+        [
+            (lambda selection: set(selection.get_selected_groups()), {"core", "dev"}),
+            (lambda selection: selection.get_total_package_count(), 3),
+            (lambda selection: selection.get_group_count(), 2),
+        ],
+        ids=["selected_groups", "total_package_count", "group_count"],
+    )
+    def test_getters(self, sample_selection, getter, expected):
+        """Test the selected-group and package count getters."""
+        assert getter(sample_selection) == expected
 
     def test_validate_against_setup_type(self, sample_setup_type):
         """Test validation against setup type."""
@@ -143,13 +146,10 @@ class TestProjectMetadata:
         )
         assert metadata.project_name == "my_project"
 
-    def test_project_name_validation_valid(self):
+    @pytest.mark.parametrize("name", ["my_project", "test_123", "_private"])
+    def test_project_name_validation_valid(self, name):
         """Test valid project names."""
-        valid_names = ["my_project", "test_123", "_private", "a"]
-        for name in valid_names:
-            if len(name) >= 3:
-                metadata = ProjectMetadata(project_name=name)
-                assert metadata.project_name == name
+        assert ProjectMetadata(project_name=name).project_name == name
 
     def test_project_name_validation_invalid_hyphen(self):
         """Test that hyphens are converted to underscores."""
@@ -197,28 +197,17 @@ class TestProjectMetadata:
         metadata = ProjectMetadata(project_name="my_project")
         assert metadata.author_name is None
 
-    def test_author_email_validation_valid(self):
+    @pytest.mark.parametrize("email", VALID_EMAILS)
+    def test_author_email_validation_valid(self, email):
         """Test valid email addresses."""
-        valid_emails = [
-            "user@example.com",
-            "john.doe@example.co.uk",
-            "test+tag@example.org",
-        ]
-        for email in valid_emails:
-            metadata = ProjectMetadata(project_name="my_project", author_email=email)
-            assert metadata.author_email == email
-
-    def test_author_email_validation_invalid(self):
+        metadata = ProjectMetadata(project_name="my_project", author_email=email)
+        assert metadata.author_email == email
+
+    @pytest.mark.parametrize("email", INVALID_EMAILS)
+    def test_author_email_validation_invalid(self, email):
         """Test invalid email addresses."""
-        invalid_emails = [
-            "not-an-email",
-            "@example.com",
-            "user@",
-            "user@.com",
-        ]
-        for email in invalid_emails:
-            with pytest.raises(ValueError, match="not a valid email"):
-                ProjectMetadata(project_name="my_project", author_email=email)
+        with pytest.raises(ValueError, match="not a valid email"):
+            ProjectMetadata(project_name="my_project", author_email=email)
 
     def test_is_valid_package_name_true(self):
         """Test static method with valid name."""
@@ -1,16 +1,19 @@
 """Tests for SetupOrchestrator."""
 
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from typysetup.commands.setup_orchestrator import SetupOrchestrator
-from typysetup.models import SetupType
+from typysetup.models import DependencySelection, ProjectMetadata, SetupType
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def setup_types():
-    """Fixture for sample setup types."""
+    """Fixture for sample setup types (shared; tests only read them)."""
     return [
         SetupType(
             name="FastAPI",
@@ -31,12 +34,21 @@ def setup_types():
     ]
 
 
+class StubConfigLoader:
+    """Minimal ConfigLoader stand-in serving a fixed list of setup types."""
+
+    def __init__(self, setup_types: List[SetupType]):
+        self.setup_types = setup_types
+
+    def load_all_setup_types(self) -> List[SetupType]:
+        """Return the configured setup types."""
+        return self.setup_types
+
+
 @pytest.fixture
 def mock_config_loader(setup_types):
-    """Fixture for mocked ConfigLoader."""
-    loader = MagicMock()
-    loader.load_all_setup_types.return_value = setup_types
-    return loader
+    """Fixture for a stubbed ConfigLoader."""
+    return StubConfigLoader(setup_types)
 
 
 @pytest.fixture
@@ -45,6 +57,19 @@ def orchestrator(mock_config_loader):
     return SetupOrchestrator(config_loader=mock_config_loader)
 
 
+@pytest.fixture
+def answer_prompt(monkeypatch):
+    """Return a function that makes ``questionary.<prompt>(...).ask()`` return an answer."""
+
+    def answer(prompt: str, value: Any) -> None:
+        monkeypatch.setattr(
+            f"typysetup.commands.setup_orchestrator.questionary.{prompt}",
+            lambda *args, **kwargs: SimpleNamespace(ask=lambda: value),
+        )
+
+    return answer
+
+
 def test_orchestrator_initialization(mock_config_loader):
     """Test orchestrator initializes with config loader."""
     orch = SetupOrchestrator(config_loader=mock_config_loader)
@@ -54,21 +79,30 @@ def test_orchestrator_initialization(mock_config_loader):
     assert orch.project_config is None
 
 
+def test_orchestrator_reset_clears_run_state(orchestrator, setup_types, tmp_path):
+    """Test reset clears wizard state but keeps collaborators."""
+    config_loader = orchestrator.config_loader
+    orchestrator.setup_type = setup_types[0]
+    orchestrator.project_path = tmp_path
+    orchestrator.cancelled = True
+
+    orchestrator.reset()
+
+    assert orchestrator.setup_type is None
+    assert orchestrator.project_path is None
+    assert orchestrator.cancelled is False
+    assert orchestrator.config_loader is config_loader
+
+
 def test_orchestrator_initialization_default_loader():
     """Test orchestrator creates default config loader."""
     orch = SetupOrchestrator()
     assert orch.config_loader is not None
 
 
-@patch("typysetup.commands.setup_orchestrator.ensure_project_directory")
-@patch("typysetup.commands.setup_orchestrator.questionary.select")
-@patch("typysetup.commands.setup_orchestrator.questionary.confirm")
-def test_select_setup_type_success(
-    mock_confirm, mock_select, mock_ensure, orchestrator, setup_types
-):
+def test_select_setup_type_success(orchestrator, answer_prompt):
     """Test successfully selecting a setup type."""
-    mock_ensure.return_value = "/tmp/test_project"
-    mock_select.return_value.ask.return_value = "FastAPI"
+    answer_prompt("select", "FastAPI")
 
     result = orchestrator._select_setup_type()
 
@@ -77,10 +111,9 @@ def test_select_setup_type_success(
     assert orchestrator.setup_type.name == "FastAPI"
 
 
-@patch("typysetup.commands.setup_orchestrator.questionary.select")
-def test_select_setup_type_cancelled(mock_select, orchestrator):
+def test_select_setup_type_cancelled(orchestrator, answer_prompt):
     """Test setup type selection when user cancels."""
-    mock_select.return_value.ask.return_value = None
+    answer_prompt("select", None)
 
     result = orchestrator._select_setup_type()
 
@@ -90,60 +123,53 @@ def test_select_setup_type_cancelled(mock_select, orchestrator):
 
 def test_select_setup_type_no_types_available(orchestrator):
     """Test selecting when no setup types are available."""
-    orchestrator.config_loader.load_all_setup_types.return_value = []
+    orchestrator.config_loader = StubConfigLoader([])
 
     result = orchestrator._select_setup_type()
 
     assert result is False
 
 
-@patch("typysetup.commands.setup_orchestrator.questionary.confirm")
-def test_select_python_version_default(mock_confirm, orchestrator, setup_types):
+def test_select_python_version_default(orchestrator, setup_types, answer_prompt):
     """Test selecting default Python version."""
     orchestrator.setup_type = setup_types[0]
-    mock_confirm.return_value.ask.return_value = True
+    answer_prompt("confirm", True)
 
     version = orchestrator._select_python_version()
 
     assert version == "3.10+"
 
 
-@patch("typysetup.commands.setup_orchestrator.questionary.confirm")
-@patch("typysetup.commands.setup_orchestrator.questionary.text")
-def test_select_python_version_custom(mock_text, mock_confirm, orchestrator, setup_types):
+def test_select_python_version_custom(orchestrator, setup_types, answer_prompt):
     """Test selecting custom Python version."""
     orchestrator.setup_type = setup_types[0]
-    mock_confirm.return_value.ask.return_value = False
-    mock_text.return_value.ask.return_value = "3.9"
+    answer_prompt("confirm", False)
+    answer_prompt("text", "3.9")
 
     version = orchestrator._select_python_version()
 
     assert version == "3.9"
 
 
-@patch("typysetup.commands.setup_orchestrator.questionary.select")
-def test_select_package_manager_multiple(mock_select, orchestrator, setup_types):
+def test_select_package_manager_multiple(orchestrator, setup_types, answer_prompt):
     """Test selecting from multiple package managers."""
     orchestrator.setup_type = setup_types[0]
-    mock_select.return_value.ask.return_value = "poetry"
+    answer_prompt("select", "poetry")
 
     manager = orchestrator._select_package_manager()
 
     assert manager == "poetry"
 
 
-def test_select_package_manager_single(orchestrator, setup_types):
+def test_select_package_manager_single(orchestrator, setup_types, answer_prompt):
     """Test when only one package manager is available."""
-    from unittest.mock import patch
-
     orchestrator.setup_type = setup_types[1]  # Django only has pip, poetry
+    answer_prompt("select", "pip")
 
-    with patch("questionary.select") as mock_select:
-        mock_select.return_value.ask.return_value = "pip"
-        manager = orchestrator._select_package_manager()
+    manager = orchestrator._select_package_manager()
 
-        # Should return selected manager
-        assert manager in orchestrator.setup_type.supported_managers
+    # Should return selected manager
+    assert manager in orchestrator.setup_type.supported_managers
 
 
 def test_select_package_manager_none_setup_type(orchestrator):
@@ -155,24 +181,22 @@ def test_select_package_manager_none_setup_type(orchestrator):
     assert manager == "pip"
 
 
-@patch("typysetup.commands.setup_orchestrator.questionary.confirm")
-def test_confirm_setup_success(mock_confirm, orchestrator, setup_types):
+def test_confirm_setup_success(orchestrator, setup_types, answer_prompt):
     """Test confirming setup configuration."""
     orchestrator.setup_type = setup_types[0]
     orchestrator.project_path = "/tmp/test"
-    mock_confirm.return_value.ask.return_value = True
+    answer_prompt("confirm", True)
 
     result = orchestrator._confirm_setup("3.10", "pip")
 
     assert result is True
 
 
-@patch("typysetup.commands.setup_orchestrator.questionary.confirm")
-def test_confirm_setup_cancelled(mock_confirm, orchestrator, setup_types):
+def test_confirm_setup_cancelled(orchestrator, setup_types, answer_prompt):
     """Test cancelling setup confirmation."""
     orchestrator.setup_type = setup_types[0]
     orchestrator.project_path = "/tmp/test"
-    mock_confirm.return_value.ask.return_value = False
+    answer_prompt("confirm", False)
 
     result = orchestrator._confirm_setup("3.10", "pip")
 
@@ -185,64 +209,46 @@ def test_display_setup_types(orchestrator, setup_types):
     orchestrator._display_setup_types(setup_types)
 
 
-@patch("typysetup.commands.setup_orchestrator.ensure_project_directory")
-@patch.object(SetupOrchestrator, "_select_setup_type")
-@patch.object(SetupOrchestrator, "_select_python_version")
-@patch.object(SetupOrchestrator, "_select_package_manager")
-@patch.object(SetupOrchestrator, "_confirm_setup")
-@patch.object(SetupOrchestrator, "_select_dependency_groups")
-@patch.object(SetupOrchestrator, "_select_vscode_extensions")
-@patch.object(SetupOrchestrator, "_collect_project_metadata")
-@patch.object(SetupOrchestrator, "_confirm_all_selections")
-@patch.object(SetupOrchestrator, "_generate_vscode_config")
-@patch.object(SetupOrchestrator, "_create_virtual_environment")
-@patch.object(SetupOrchestrator, "_generate_pyproject_toml")
-@patch.object(SetupOrchestrator, "_install_dependencies")
-def test_run_setup_wizard_success(
-    mock_install_deps,
-    mock_pyproject,
-    mock_create_venv,
-    mock_vscode_config,
-    mock_confirm_all,
-    mock_metadata,
-    mock_extensions,
-    mock_deps,
-    mock_confirm,
-    mock_manager,
-    mock_version,
-    mock_type,
-    mock_ensure,
-    orchestrator,
-    setup_types,
-):
-    """Test running complete setup wizard successfully."""
-    from pathlib import Path
-
-    from typysetup.models import DependencySelection, ProjectMetadata
-
-    mock_ensure.return_value = Path("/tmp/test_project")
-    mock_type.return_value = True
-    mock_version.return_value = "3.10"
-    mock_manager.return_value = "pip"
-    mock_confirm.return_value = True
-    mock_deps.return_value = DependencySelection(
-        setup_type_slug="fastapi",
-        selected_groups={"core": True},
-        all_packages=["fastapi>=0.104"],
+@pytest.fixture
+def mocked_orchestrator(monkeypatch, orchestrator, setup_types):
+    """Orchestrator whose wizard steps all succeed without prompts or side effects."""
+    step_results = {
+        "_generate_gitignore": True,
+        "_select_setup_type": True,
+        "_select_python_version": "3.10",
+        "_select_package_manager": "pip",
+        "_confirm_setup": True,
+        "_select_dependency_groups": DependencySelection(
+            setup_type_slug="fastapi",
+            selected_groups={"core": True},
+            all_packages=["fastapi>=0.104"],
+        ),
+        "_select_vscode_extensions": [],
+        "_collect_project_metadata": ProjectMetadata(project_name="test_project"),
+        "_confirm_all_selections": True,
+        "_generate_vscode_config": True,
+        "_create_virtual_environment": True,
+        "_prompt_continue": True,
+        "_generate_pyproject_toml": True,
+        "_install_dependencies": True,
+    }
+    for name, value in step_results.items():
+        monkeypatch.setattr(orchestrator, name, lambda *args, _value=value, **kwargs: _value)
+
+    monkeypatch.setattr(
+        "typysetup.commands.setup_orchestrator.ensure_project_directory", lambda path: Path(path)
     )
-    mock_extensions.return_value = []
-    mock_metadata.return_value = ProjectMetadata(project_name="test_project")
-    mock_confirm_all.return_value = True
-    mock_vscode_config.return_value = True
-    mock_create_venv.return_value = True
-    mock_pyproject.return_value = True
-    mock_install_deps.return_value = True
+    monkeypatch.setattr(orchestrator, "preference_manager", MagicMock())
     orchestrator.setup_type = setup_types[0]
+    return orchestrator
 
-    result = orchestrator.run_setup_wizard("/tmp/test_project")
+
+def test_run_setup_wizard_success(mocked_orchestrator, tmp_path):
+    """Test running complete setup wizard successfully."""
+    result = mocked_orchestrator.run_setup_wizard(str(tmp_path))
 
     assert result is not None
-    assert result.project_path == "/tmp/test_project"
+    assert result.project_path == str(tmp_path)
     assert result.setup_type_slug == "fastapi"
     assert result.python_version == "3.10"
     assert result.package_manager == "pip"
@@ -120,6 +120,23 @@ class TestFileBackupManager:
         assert backup1 in backups
         assert backup2 in backups
 
+    def test_list_backups_ignores_other_files(self, temp_vscode_dir):
+        """Test that only backups of the given file are listed."""
+        original_file = temp_vscode_dir / "settings.json"
+        original_file.write_text('{"test": true}')
+        (temp_vscode_dir / "settings.json.backup").write_text("{}")
+        (temp_vscode_dir / "launch.json.backup.20260101T000000.000000Z").write_text("{}")
+
+        manager = FileBackupManager()
+        backup = manager.create_backup(original_file)
+
+        assert manager.list_backups(original_file) == [backup]
+
+    def test_list_backups_missing_directory(self, tmp_path):
+        """Test listing backups when the parent directory does not exist."""
+        manager = FileBackupManager()
+        assert manager.list_backups(tmp_path / "missing" / "settings.json") == []
+
     def test_cleanup_backup(self, temp_vscode_dir):
         """Test deleting a backup."""
         original_file = temp_vscode_dir / "settings.json"